@@ -5,30 +5,35 @@ PySide6-based GUI for managing biometric and WebAuthn credentials
 """
 
 import sys
-import os
 import json
+import subprocess
 import asyncio
-import threading
+import functools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
-from datetime import datetime
 
 try:
+    # Dialog classes (QMessageBox, QFileDialog) are imported where they are used
     from PySide6.QtWidgets import (
-        QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
-        QPushButton, QLabel, QMessageBox, QTabWidget,
-        QTextEdit, QLineEdit, QComboBox, QCheckBox,
-        QGroupBox, QGridLayout, QProgressBar, QStatusBar,
-        QMainWindow, QMenuBar, QMenu, QAction, QFileDialog,
-        QTableWidget, QTableWidgetItem, QHeaderView
+        QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+        QPushButton, QLabel, QTabWidget, QPlainTextEdit,
+        QLineEdit, QCheckBox, QGroupBox, QGridLayout,
+        QProgressBar, QStatusBar, QMainWindow,
+        QTableView, QAbstractItemView
     )
-    from PySide6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSettings
-    from PySide6.QtGui import QFont, QIcon, QPixmap, QPalette, QColor
+    from PySide6.QtCore import Qt, QTimer, QSettings, QAbstractTableModel, QModelIndex
+    from PySide6.QtGui import QAction, QFont, QPalette, QColor
+    import PySide6.QtAsyncio as QtAsyncio
     PYSIDE6_AVAILABLE = True
 except ImportError:
     print("❌ PySide6 not available. Install with: pip install PySide6")
     PYSIDE6_AVAILABLE = False
 
+from utils.paths import WEBAUTHN_CREDENTIALS_FILE
+
 # Import our modules
 try:
     from windows_hello import biometric_authenticate_sync, check_biometric_availability
@@ -42,45 +47,148 @@ except ImportError as e:
 # Setup logging
 logger = setup_logger(__name__) if 'setup_logger' in globals() else None
 
-class BiometricWorker(QThread):
-    """Worker thread for biometric operations"""
-    authentication_complete = pyqtSignal(bool, str)
-    status_update = pyqtSignal(str)
+# Single shared worker for blocking biometric calls; the OS serializes them anyway
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="biometric")
+
+# Log display limits
+LOG_MAX_LINES = 5000
+LOG_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_FLUSH_INTERVAL_MS = 100
+STATUS_COALESCE_MS = 50
+
+# Credential store written by webauthn_server.py
+CREDENTIALS_FILE = WEBAUTHN_CREDENTIALS_FILE
+
+@functools.lru_cache(maxsize=1)
+def build_dark_palette() -> "QPalette":
+    """Build the application-wide dark theme palette (cached)"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(53, 53, 53))
+    palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
+    palette.setColor(QPalette.Base, QColor(25, 25, 25))
+    palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+    palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
+    palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
+    palette.setColor(QPalette.Text, QColor(255, 255, 255))
+    palette.setColor(QPalette.Button, QColor(53, 53, 53))
+    palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
+    palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
+    palette.setColor(QPalette.Link, QColor(42, 130, 218))
+    palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+    palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+    return palette
+
+class CredentialModel(QAbstractTableModel):
+    """Table model for registered credentials, stored as one list per column"""
     
-    def __init__(self, operation: str, reason: str = ""):
-        super().__init__()
-        self.operation = operation
-        self.reason = reason
+    HEADERS = ("User ID", "Name", "Device", "Registration Date")
     
-    def run(self):
-        """Run the biometric operation"""
-        try:
-            if self.operation == "authenticate":
-                self.status_update.emit("Requesting biometric authentication...")
-                success = biometric_authenticate_sync(self.reason)
-                if success:
-                    self.authentication_complete.emit(True, "Authentication successful")
-                else:
-                    self.authentication_complete.emit(False, "Authentication failed or canceled")
-            elif self.operation == "check_availability":
-                self.status_update.emit("Checking biometric availability...")
-                available = check_biometric_availability()
-                if available:
-                    self.authentication_complete.emit(True, "Biometric hardware available")
-                else:
-                    self.authentication_complete.emit(False, "No biometric hardware available")
-        except Exception as e:
-            self.authentication_complete.emit(False, f"Error: {str(e)}")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = tuple([] for _ in self.HEADERS)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns[0])
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Reorder every column by the values of one"""
+        self.layoutAboutToBeChanged.emit()
+        keys = self._columns[column]
+        order_idx = sorted(range(len(keys)), key=keys.__getitem__,
+                           reverse=order == Qt.DescendingOrder)
+        self._columns = tuple([col[i] for i in order_idx] for col in self._columns)
+        self.layoutChanged.emit()
+    
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if row < 0 or count <= 0 or row + count > self.rowCount():
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for col in self._columns:
+            del col[row:row + count]
+        self.endRemoveRows()
+        return True
+    
+    def set_rows(self, rows):
+        """Replace the model contents with (user_id, name, device, date) rows"""
+        self.beginResetModel()
+        self._columns = tuple([str(value) for value in col] for col in zip(*rows)) if rows \
+            else tuple([] for _ in self.HEADERS)
+        self.endResetModel()
 
 class BiometricManagerGUI(QMainWindow):
     """Main GUI window for biometric credential management"""
     
+    # Status label styles, shared so transitions don't build new QSS strings
+    _STYLE_BOLD = "font-weight: bold;"
+    _STYLE_OK = "font-weight: bold; color: green;"
+    _STYLE_FAIL = "font-weight: bold; color: red;"
+    
+    # Persisted settings: (key, default, type)
+    _SETTINGS_DEFAULTS = (
+        ("auth_reason", "Authenticate to unlock IGED", str),
+        ("auto_launch", True, bool),
+        ("remember_reason", True, bool),
+        ("server_port", "5000", str),
+    )
+    
     def __init__(self):
         super().__init__()
-        self.settings = QSettings("IGED", "BiometricManager")
-        self.crypto_manager = CryptoManager() if 'CryptoManager' in globals() else None
+        # On Linux an INI file is one read/write; elsewhere keep the native store (the registry on Windows)
+        if sys.platform.startswith("linux"):
+            self.settings = QSettings(QSettings.IniFormat, QSettings.UserScope, "IGED", "BiometricManager")
+        else:
+            self.settings = QSettings("IGED", "BiometricManager")
+        self._migrate_legacy_settings()
+        self._crypto_manager = None
+        self._iged_process = None
+        self._auth_inflight = False
+        # The loop only holds weak references to tasks, so keep running ones alive here
+        self._tasks = set()
+        # Resolve the IGED launcher once; CWD-relative lookups break when CWD changes
+        self._iged_launcher = (Path(__file__).parent.parent / "launcher.py").resolve()
+        self._iged_launcher_exists = self._iged_launcher.is_file()
+        # Log lines are buffered and flushed in one append per timer tick
+        self._log_buf = deque(maxlen=LOG_MAX_LINES)
+        # Widgets on lazily built tabs; None until the tab is first shown
+        self.server_port_input = None
+        self.credential_count_label = None
+        self.log_display = None
+        self._server_port = "5000"
+        self.credential_model = CredentialModel(self)
         self.init_ui()
         self.load_settings()
+        self.launch_iged_btn.setEnabled(self._iged_launcher_exists)
+    
+    def _start_task(self, coro):
+        """Schedule a coroutine on the QtAsyncio loop and hold it until it finishes"""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    def _connect_async(self, signal, coro_func):
+        """Connect a Qt signal to a coroutine function scheduled on the QtAsyncio loop"""
+        signal.connect(lambda *args: self._start_task(coro_func()))
+    
+    @property
+    def crypto_manager(self):
+        """Crypto manager, created on first use (key setup is costly at startup)"""
+        if self._crypto_manager is None and 'CryptoManager' in globals():
+            self._crypto_manager = CryptoManager()
+        return self._crypto_manager
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -88,9 +196,6 @@ class BiometricManagerGUI(QMainWindow):
         self.setMinimumSize(800, 600)
         self.setGeometry(100, 100, 1000, 700)
         
-        # Set dark theme
-        self.set_dark_theme()
-        
         # Create central widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -103,11 +208,15 @@ class BiometricManagerGUI(QMainWindow):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
+        # Create tabs; only the biometric tab is built up front, the rest on first view
         self.create_biometric_tab()
-        self.create_webauthn_tab()
-        self.create_credentials_tab()
-        self.create_logs_tab()
+        self._tab_builders = {}
+        for title, builder in (("WebAuthn Management", self.create_webauthn_tab),
+                               ("Credentials", self.create_credentials_tab),
+                               ("Logs", self.create_logs_tab)):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         # Create status bar
         self.status_bar = QStatusBar()
@@ -118,6 +227,19 @@ class BiometricManagerGUI(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
+        
+        # Log flush timer
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+        self._log_timer.start()
+        
+        # Status messages are coalesced so bursts cause a single repaint
+        self._pending_status: Optional[str] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_COALESCE_MS)
+        self._status_timer.timeout.connect(self._flush_status)
     
     def create_menu_bar(self):
         """Create the menu bar"""
@@ -148,13 +270,17 @@ class BiometricManagerGUI(QMainWindow):
         
         test_auth_action = QAction("&Test Authentication", self)
         test_auth_action.setShortcut("Ctrl+T")
-        test_auth_action.triggered.connect(self.test_authentication)
+        self._connect_async(test_auth_action.triggered, self.test_authentication)
         tools_menu.addAction(test_auth_action)
         
         check_hardware_action = QAction("&Check Hardware", self)
-        check_hardware_action.triggered.connect(self.check_hardware)
+        self._connect_async(check_hardware_action.triggered, self.check_hardware)
         tools_menu.addAction(check_hardware_action)
         
+        rescan_action = QAction("&Rescan IGED Installation", self)
+        rescan_action.triggered.connect(self.rescan_iged)
+        tools_menu.addAction(rescan_action)
+        
         # Help menu
         help_menu = menubar.addMenu("&Help")
         
@@ -172,12 +298,12 @@ class BiometricManagerGUI(QMainWindow):
         status_layout = QGridLayout(status_group)
         
         self.hardware_status_label = QLabel("Hardware: Unknown")
-        self.hardware_status_label.setStyleSheet("font-weight: bold;")
+        self.hardware_status_label.setStyleSheet(self._STYLE_BOLD)
         status_layout.addWidget(QLabel("Hardware Status:"), 0, 0)
         status_layout.addWidget(self.hardware_status_label, 0, 1)
         
         self.auth_status_label = QLabel("Authentication: Not tested")
-        self.auth_status_label.setStyleSheet("font-weight: bold;")
+        self.auth_status_label.setStyleSheet(self._STYLE_BOLD)
         status_layout.addWidget(QLabel("Authentication Status:"), 1, 0)
         status_layout.addWidget(self.auth_status_label, 1, 1)
         
@@ -198,15 +324,15 @@ class BiometricManagerGUI(QMainWindow):
         button_layout = QHBoxLayout()
         
         self.check_hardware_btn = QPushButton("Check Hardware")
-        self.check_hardware_btn.clicked.connect(self.check_hardware)
+        self._connect_async(self.check_hardware_btn.clicked, self.check_hardware)
         button_layout.addWidget(self.check_hardware_btn)
         
         self.authenticate_btn = QPushButton("Authenticate")
-        self.authenticate_btn.clicked.connect(self.test_authentication)
+        self._connect_async(self.authenticate_btn.clicked, self.test_authentication)
         button_layout.addWidget(self.authenticate_btn)
         
         self.launch_iged_btn = QPushButton("Launch IGED")
-        self.launch_iged_btn.clicked.connect(self.launch_iged)
+        self._connect_async(self.launch_iged_btn.clicked, self.launch_iged)
         button_layout.addWidget(self.launch_iged_btn)
         
         auth_layout.addLayout(button_layout)
@@ -231,9 +357,8 @@ class BiometricManagerGUI(QMainWindow):
         
         self.tab_widget.addTab(tab, "Biometric Authentication")
     
-    def create_webauthn_tab(self):
-        """Create the WebAuthn management tab"""
-        tab = QWidget()
+    def create_webauthn_tab(self, tab: QWidget):
+        """Build the WebAuthn management tab into its placeholder widget"""
         layout = QVBoxLayout(tab)
         
         # Server status group
@@ -241,11 +366,11 @@ class BiometricManagerGUI(QMainWindow):
         server_layout = QGridLayout(server_group)
         
         self.server_status_label = QLabel("Server: Not running")
-        self.server_status_label.setStyleSheet("font-weight: bold; color: red;")
+        self.server_status_label.setStyleSheet(self._STYLE_FAIL)
         server_layout.addWidget(QLabel("Status:"), 0, 0)
         server_layout.addWidget(self.server_status_label, 0, 1)
         
-        self.server_port_input = QLineEdit("5000")
+        self.server_port_input = QLineEdit(self._server_port)
         server_layout.addWidget(QLabel("Port:"), 1, 0)
         server_layout.addWidget(self.server_port_input, 1, 1)
         
@@ -269,19 +394,19 @@ class BiometricManagerGUI(QMainWindow):
         credentials_group = QGroupBox("Registered Credentials")
         credentials_layout = QVBoxLayout(credentials_group)
         
-        self.credentials_table = QTableWidget()
-        self.credentials_table.setColumnCount(4)
-        self.credentials_table.setHorizontalHeaderLabels([
-            "User ID", "Name", "Device", "Registration Date"
-        ])
+        self.credentials_table = QTableView()
+        self.credentials_table.setModel(self.credential_model)
+        self.credentials_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.credentials_table.setSortingEnabled(True)
         self.credentials_table.horizontalHeader().setStretchLastSection(True)
+        self.credentials_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerItem)
         credentials_layout.addWidget(self.credentials_table)
         
         # Table controls
         table_controls_layout = QHBoxLayout()
         
         self.refresh_credentials_btn = QPushButton("Refresh")
-        self.refresh_credentials_btn.clicked.connect(self.refresh_credentials)
+        self._connect_async(self.refresh_credentials_btn.clicked, self.refresh_credentials)
         table_controls_layout.addWidget(self.refresh_credentials_btn)
         
         self.delete_credential_btn = QPushButton("Delete Selected")
@@ -290,12 +415,9 @@ class BiometricManagerGUI(QMainWindow):
         
         credentials_layout.addLayout(table_controls_layout)
         layout.addWidget(credentials_group)
-        
-        self.tab_widget.addTab(tab, "WebAuthn Management")
     
-    def create_credentials_tab(self):
-        """Create the credentials management tab"""
-        tab = QWidget()
+    def create_credentials_tab(self, tab: QWidget):
+        """Build the credentials management tab into its placeholder widget"""
         layout = QVBoxLayout(tab)
         
         # Credential info
@@ -327,12 +449,9 @@ class BiometricManagerGUI(QMainWindow):
         
         # Add stretch
         layout.addStretch()
-        
-        self.tab_widget.addTab(tab, "Credentials")
     
-    def create_logs_tab(self):
-        """Create the logs tab"""
-        tab = QWidget()
+    def create_logs_tab(self, tab: QWidget):
+        """Build the logs tab into its placeholder widget"""
         layout = QVBoxLayout(tab)
         
         # Log controls
@@ -349,59 +468,80 @@ class BiometricManagerGUI(QMainWindow):
         layout.addLayout(log_controls_layout)
         
         # Log display
-        self.log_display = QTextEdit()
+        # Plain text with a block cap: O(1) appends, oldest lines dropped
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(LOG_MAX_LINES)
+        self.log_display.setUndoRedoEnabled(False)
         self.log_display.setFont(QFont("Consolas", 10))
         layout.addWidget(self.log_display)
-        
-        self.tab_widget.addTab(tab, "Logs")
-    
-    def set_dark_theme(self):
-        """Apply dark theme to the application"""
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
-        palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
-        palette.setColor(QPalette.Text, QColor(255, 255, 255))
-        palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-        palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
-        palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        
-        self.setPalette(palette)
-    
-    def check_hardware(self):
+    
+    def _ensure_tab_built(self, index: int):
+        """Build a deferred tab the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self.tab_widget.widget(index))
+    
+    def _set_auth_busy(self, busy: bool):
+        """Mark a biometric operation as in flight and lock the triggering buttons"""
+        self._auth_inflight = busy
+        self.check_hardware_btn.setEnabled(not busy)
+        self.authenticate_btn.setEnabled(not busy)
+    
+    async def check_hardware(self):
         """Check biometric hardware availability"""
-        self.status_bar.showMessage("Checking biometric hardware...")
+        if self._auth_inflight:
+            return
+        self._set_auth_busy(True)
+        
+        self._queue_status("Checking biometric hardware...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
-        # Run in worker thread
-        self.worker = BiometricWorker("check_availability")
-        self.worker.authentication_complete.connect(self.on_hardware_check_complete)
-        self.worker.status_update.connect(self.status_bar.showMessage)
-        self.worker.start()
+        # Run the blocking check on the shared executor; we resume on the Qt loop
+        loop = asyncio.get_running_loop()
+        try:
+            available = await loop.run_in_executor(_EXECUTOR, check_biometric_availability)
+        except Exception as e:
+            self.on_hardware_check_complete(False, f"Error: {str(e)}")
+            return
+        finally:
+            self._set_auth_busy(False)
+        
+        if available:
+            self.on_hardware_check_complete(True, "Biometric hardware available")
+        else:
+            self.on_hardware_check_complete(False, "No biometric hardware available")
     
-    def test_authentication(self):
+    async def test_authentication(self):
         """Test biometric authentication"""
+        if self._auth_inflight:
+            return
+        self._set_auth_busy(True)
+        
         reason = self.reason_input.text()
         if not reason:
             reason = "Test authentication for IGED"
         
-        self.status_bar.showMessage("Testing biometric authentication...")
+        self._queue_status("Testing biometric authentication...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)
         
-        # Run in worker thread
-        self.worker = BiometricWorker("authenticate", reason)
-        self.worker.authentication_complete.connect(self.on_authentication_complete)
-        self.worker.status_update.connect(self.status_bar.showMessage)
-        self.worker.start()
+        # Run the blocking prompt on the shared executor; we resume on the Qt loop
+        loop = asyncio.get_running_loop()
+        self._queue_status("Requesting biometric authentication...")
+        try:
+            success = await loop.run_in_executor(_EXECUTOR, biometric_authenticate_sync, reason)
+        except Exception as e:
+            self.on_authentication_complete(False, f"Error: {str(e)}")
+            return
+        finally:
+            self._set_auth_busy(False)
+        
+        if success:
+            self.on_authentication_complete(True, "Authentication successful")
+        else:
+            self.on_authentication_complete(False, "Authentication failed or canceled")
     
     def on_hardware_check_complete(self, success: bool, message: str):
         """Handle hardware check completion"""
@@ -409,12 +549,11 @@ class BiometricManagerGUI(QMainWindow):
         
         if success:
             self.hardware_status_label.setText("Hardware: Available ✅")
-            self.hardware_status_label.setStyleSheet("font-weight: bold; color: green;")
         else:
             self.hardware_status_label.setText("Hardware: Not Available ❌")
-            self.hardware_status_label.setStyleSheet("font-weight: bold; color: red;")
+        self.hardware_status_label.setStyleSheet(self._STYLE_OK if success else self._STYLE_FAIL)
         
-        self.status_bar.showMessage(message)
+        self._queue_status(message)
         self.log_message(f"Hardware check: {message}")
     
     def on_authentication_complete(self, success: bool, message: str):
@@ -423,27 +562,31 @@ class BiometricManagerGUI(QMainWindow):
         
         if success:
             self.auth_status_label.setText("Authentication: Successful ✅")
-            self.auth_status_label.setStyleSheet("font-weight: bold; color: green;")
+            self.auth_status_label.setStyleSheet(self._STYLE_OK)
             
             # Auto-launch IGED if enabled
             if self.auto_launch_checkbox.isChecked():
-                self.launch_iged()
+                self._start_task(self.launch_iged())
         else:
             self.auth_status_label.setText("Authentication: Failed ❌")
-            self.auth_status_label.setStyleSheet("font-weight: bold; color: red;")
+            self.auth_status_label.setStyleSheet(self._STYLE_FAIL)
         
-        self.status_bar.showMessage(message)
+        self._queue_status(message)
         self.log_message(f"Authentication: {message}")
     
-    def launch_iged(self):
+    async def launch_iged(self):
         """Launch IGED after successful authentication"""
+        from PySide6.QtWidgets import QMessageBox
+        
         try:
-            # Look for IGED launcher in parent directory
-            iged_launcher = Path("../launcher.py")
-            if iged_launcher.exists():
-                import subprocess
-                subprocess.Popen([sys.executable, str(iged_launcher)])
-                self.status_bar.showMessage("IGED launched successfully")
+            if self._iged_launcher_exists:
+                # QtAsyncio's loop has no subprocess support, so spawn off the GUI thread instead.
+                # The default executor keeps the launch from queueing behind a biometric prompt.
+                loop = asyncio.get_running_loop()
+                self._iged_process = await loop.run_in_executor(
+                    None, subprocess.Popen, [sys.executable, str(self._iged_launcher)]
+                )
+                self._queue_status("IGED launched successfully")
                 self.log_message("IGED launched successfully")
             else:
                 QMessageBox.warning(self, "IGED Not Found", 
@@ -451,106 +594,208 @@ class BiometricManagerGUI(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Launch Error", f"Failed to launch IGED: {str(e)}")
     
+    def rescan_iged(self):
+        """Re-check whether the IGED launcher is present"""
+        self._iged_launcher_exists = self._iged_launcher.is_file()
+        self.launch_iged_btn.setEnabled(self._iged_launcher_exists)
+        if self._iged_launcher_exists:
+            self._queue_status(f"IGED launcher found: {self._iged_launcher}")
+        else:
+            self._queue_status("IGED launcher not found")
+        self.log_message(f"IGED rescan: {'found' if self._iged_launcher_exists else 'not found'}")
+    
     def start_webauthn_server(self):
         """Start the WebAuthn server"""
         # This would integrate with webauthn_server.py
         self.server_status_label.setText("Server: Running ✅")
-        self.server_status_label.setStyleSheet("font-weight: bold; color: green;")
+        self.server_status_label.setStyleSheet(self._STYLE_OK)
         self.start_server_btn.setEnabled(False)
         self.stop_server_btn.setEnabled(True)
-        self.status_bar.showMessage("WebAuthn server started")
+        self._queue_status("WebAuthn server started")
         self.log_message("WebAuthn server started")
     
     def stop_webauthn_server(self):
         """Stop the WebAuthn server"""
         self.server_status_label.setText("Server: Stopped ❌")
-        self.server_status_label.setStyleSheet("font-weight: bold; color: red;")
+        self.server_status_label.setStyleSheet(self._STYLE_FAIL)
         self.start_server_btn.setEnabled(True)
         self.stop_server_btn.setEnabled(False)
-        self.status_bar.showMessage("WebAuthn server stopped")
+        self._queue_status("WebAuthn server stopped")
         self.log_message("WebAuthn server stopped")
     
-    def refresh_credentials(self):
+    def _load_credential_rows(self) -> list:
+        """Load registered WebAuthn credentials as table rows"""
+        if not CREDENTIALS_FILE.exists():
+            return []
+        with open(CREDENTIALS_FILE, 'r', encoding='utf-8') as f:
+            registered_users = json.load(f)
+        
+        rows = []
+        for user_id, user_data in registered_users.items():
+            name = user_data.get('user', {}).get('name', '')
+            for cred in user_data.get('credentials', []):
+                rows.append((user_id, name, cred.get('device', 'WebAuthn'), cred.get('registered', '')))
+        return rows
+    
+    async def refresh_credentials(self):
         """Refresh the credentials table"""
-        # This would load credentials from storage
-        self.credential_count_label.setText("0")
-        self.status_bar.showMessage("Credentials refreshed")
+        from PySide6.QtWidgets import QMessageBox
+        
+        try:
+            loop = asyncio.get_running_loop()
+            rows = await loop.run_in_executor(_EXECUTOR, self._load_credential_rows)
+        except Exception as e:
+            QMessageBox.critical(self, "Refresh Error", f"Failed to load credentials: {str(e)}")
+            return
+        
+        # A single model reset; the view pulls cells on demand
+        self.credential_model.set_rows(rows)
+        
+        if self.credential_count_label is not None:
+            self.credential_count_label.setText(str(len(rows)))
+        self._queue_status("Credentials refreshed")
         self.log_message("Credentials refreshed")
     
     def delete_credential(self):
         """Delete selected credential"""
-        current_row = self.credentials_table.currentRow()
+        current_row = self.credentials_table.currentIndex().row()
         if current_row >= 0:
-            self.credentials_table.removeRow(current_row)
-            self.status_bar.showMessage("Credential deleted")
+            self.credential_model.removeRows(current_row, 1)
+            self._queue_status("Credential deleted")
             self.log_message("Credential deleted")
     
     def export_credentials(self):
         """Export credentials to file"""
+        from PySide6.QtWidgets import QFileDialog
+        
         filename, _ = QFileDialog.getSaveFileName(
             self, "Export Credentials", "", "JSON Files (*.json)"
         )
         if filename:
             # Export logic here
-            self.status_bar.showMessage("Credentials exported")
+            self._queue_status("Credentials exported")
             self.log_message(f"Credentials exported to {filename}")
     
     def import_credentials(self):
         """Import credentials from file"""
+        from PySide6.QtWidgets import QFileDialog
+        
         filename, _ = QFileDialog.getOpenFileName(
             self, "Import Credentials", "", "JSON Files (*.json)"
         )
         if filename:
             # Import logic here
-            self.status_bar.showMessage("Credentials imported")
+            self._queue_status("Credentials imported")
             self.log_message(f"Credentials imported from {filename}")
     
     def clear_logs(self):
         """Clear the log display"""
+        self._log_buf.clear()
         self.log_display.clear()
-        self.status_bar.showMessage("Logs cleared")
+        self._queue_status("Logs cleared")
     
     def save_logs(self):
         """Save logs to file"""
+        from PySide6.QtWidgets import QFileDialog, QMessageBox
+        
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Logs", "", "Text Files (*.txt)"
         )
         if filename:
+            self._flush_logs()
             try:
-                with open(filename, 'w') as f:
-                    f.write(self.log_display.toPlainText())
-                self.status_bar.showMessage("Logs saved")
+                # Stream block by block rather than copying the whole document
+                document = self.log_display.document()
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    block = document.begin()
+                    while block.isValid():
+                        f.write(block.text())
+                        f.write("\n")
+                        block = block.next()
+                self._queue_status("Logs saved")
                 self.log_message(f"Logs saved to {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save logs: {str(e)}")
     
     def show_about(self):
         """Show about dialog"""
+        from PySide6.QtWidgets import QMessageBox
+        
         QMessageBox.about(self, "About IGED Biometric Manager",
                          "IGED Biometric Credential Manager\n\n"
                          "Version 1.0.0\n"
                          "Enterprise-grade biometric authentication for IGED\n\n"
                          "Supports Windows Hello and WebAuthn")
     
+    def _queue_status(self, message: str):
+        """Schedule a status bar message; only the latest one per tick is shown"""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        """Show the most recent queued status message"""
+        if self._pending_status is not None:
+            self.status_bar.showMessage(self._pending_status)
+            self._pending_status = None
+    
     def log_message(self, message: str):
         """Add message to log display"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_display.append(f"[{timestamp}] {message}")
+        timestamp = time.strftime(LOG_TIMESTAMP_FORMAT, time.localtime())
+        self._log_buf.append(f"[{timestamp}] {message}")
+    
+    def _flush_logs(self):
+        """Append buffered log lines to the display in a single update"""
+        # Lines stay buffered until the logs tab has been built
+        if self._log_buf and self.log_display is not None:
+            self.log_display.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
+    
+    def _migrate_legacy_settings(self):
+        """Move settings saved before the "biometric" group into it, once"""
+        legacy = QSettings("IGED", "BiometricManager")
+        keys = [key for key, _, _ in self._SETTINGS_DEFAULTS if legacy.contains(key)]
+        if not keys:
+            return
+        
+        for key in keys:
+            if not self.settings.contains(f"biometric/{key}"):
+                self.settings.setValue(f"biometric/{key}", legacy.value(key))
+            legacy.remove(key)
+        legacy.sync()
+        self.settings.sync()
     
     def load_settings(self):
         """Load application settings"""
-        self.reason_input.setText(self.settings.value("auth_reason", "Authenticate to unlock IGED"))
-        self.auto_launch_checkbox.setChecked(self.settings.value("auto_launch", True, type=bool))
-        self.remember_reason_checkbox.setChecked(self.settings.value("remember_reason", True, type=bool))
-        self.server_port_input.setText(self.settings.value("server_port", "5000"))
+        appliers = {
+            "auth_reason": self.reason_input.setText,
+            "auto_launch": self.auto_launch_checkbox.setChecked,
+            "remember_reason": self.remember_reason_checkbox.setChecked,
+            "server_port": lambda port: setattr(self, "_server_port", port),
+        }
+        
+        self.settings.beginGroup("biometric")
+        for key, default, value_type in self._SETTINGS_DEFAULTS:
+            # Strings come back as str already; only non-str values need coercion
+            if value_type is str:
+                value = self.settings.value(key, default)
+            else:
+                value = self.settings.value(key, default, type=value_type)
+            appliers[key](value)
+        self.settings.endGroup()
     
     def save_settings(self):
         """Save application settings"""
+        self.settings.beginGroup("biometric")
         if self.remember_reason_checkbox.isChecked():
             self.settings.setValue("auth_reason", self.reason_input.text())
         self.settings.setValue("auto_launch", self.auto_launch_checkbox.isChecked())
         self.settings.setValue("remember_reason", self.remember_reason_checkbox.isChecked())
-        self.settings.setValue("server_port", self.server_port_input.text())
+        if self.server_port_input is not None:
+            self._server_port = self.server_port_input.text()
+        self.settings.setValue("server_port", self._server_port)
+        self.settings.endGroup()
+        self.settings.sync()
     
     def closeEvent(self, event):
         """Handle application close event"""
@@ -567,10 +812,16 @@ def main():
     app.setApplicationName("IGED Biometric Manager")
     app.setApplicationVersion("1.0.0")
     
+    # Apply the dark theme once for the whole application; Fusion honours palettes
+    app.setStyle("Fusion")
+    app.setPalette(build_dark_palette())
+    
     window = BiometricManagerGUI()
     window.show()
     
-    sys.exit(app.exec())
+    # Drive the Qt event loop through asyncio so handlers can be coroutines
+    QtAsyncio.run(keep_running=True, handle_sigint=True)
+    _EXECUTOR.shutdown(wait=False)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
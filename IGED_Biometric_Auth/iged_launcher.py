@@ -8,20 +8,61 @@ import sys
 import os
 import subprocess
 import time
-import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-# Import biometric modules
-try:
-    from windows_hello import biometric_authenticate_sync, check_biometric_availability
-    from PySide6.QtWidgets import QApplication, QMessageBox, QProgressDialog, QLabel
-    from PySide6.QtCore import Qt, QTimer
-    from PySide6.QtGui import QFont
-    BIOMETRIC_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ Biometric modules not available: {e}")
-    BIOMETRIC_AVAILABLE = False
+# Biometric and Qt modules are imported on first use; None means not tried yet
+BIOMETRIC_AVAILABLE = None
+
+def _load_biometric_modules() -> bool:
+    """Import the Windows Hello and PySide6 modules the first time they are needed"""
+    global BIOMETRIC_AVAILABLE, biometric_authenticate_sync, check_biometric_availability
+    global QApplication, QMessageBox, QProgressDialog, Qt, QThread
+    
+    if BIOMETRIC_AVAILABLE is None:
+        try:
+            from windows_hello import biometric_authenticate_sync, check_biometric_availability
+            from PySide6.QtWidgets import QApplication, QMessageBox, QProgressDialog
+            from PySide6.QtCore import Qt, QThread
+            BIOMETRIC_AVAILABLE = True
+        except ImportError as e:
+            print(f"⚠️ Biometric modules not available: {e}")
+            BIOMETRIC_AVAILABLE = False
+    
+    return BIOMETRIC_AVAILABLE
+
+# Remembers where IGED was found so later runs stat one path instead of probing.
+# Holds two lines: the working directory it was found from, then the launcher path.
+LAUNCHER_CACHE_FILE = Path.home() / ".iged" / "launcher.cache"
+
+class SpawnedProcess:
+    """Minimal Popen-like handle for a child started with os.posix_spawn"""
+    
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.returncode = None
+    
+    def poll(self) -> Optional[int]:
+        """Return the exit code if the child has finished, else None"""
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = self._exit_code(status)
+        return self.returncode
+    
+    def wait(self) -> int:
+        """Wait for the child to finish and return its exit code"""
+        if self.returncode is None:
+            _, status = os.waitpid(self.pid, 0)
+            self.returncode = self._exit_code(status)
+        return self.returncode
+    
+    @staticmethod
+    def _exit_code(status: int) -> int:
+        """Convert a waitpid status to a Popen-style return code"""
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status)
+        return os.WEXITSTATUS(status)
 
 class SecureIGEDLauncher:
     """Secure launcher for IGED with biometric authentication"""
@@ -31,14 +72,31 @@ class SecureIGEDLauncher:
         self.iged_process = None
         self.auth_attempts = 0
         self.max_attempts = 3
-        self.lockout_duration = 300  # 5 minutes
+        self.lockout_duration = 300  # 5 minutes (maximum lockout)
         self.last_failed_attempt = 0
         
+        # Weighted failure accounting: lock once the accumulated weight reaches
+        # the threshold, for a period that doubles with each further failure
+        self.hit_count = 0.0
+        self.lockout_threshold = float(self.max_attempts)
+        self.backoff_base = 30  # seconds
+        self.backoff = 0.0
+        # Earliest monotonic time at which another attempt is accepted
+        self._next_allowed_at = 0.0
+        # Cached hardware availability (each check is a WinRT round-trip)
+        self._biometric_ok = None
+        
         # Find IGED installation
         self.find_iged_installation()
     
     def find_iged_installation(self):
         """Find IGED installation directory"""
+        cached = self._read_cached_path()
+        if cached is not None:
+            self.iged_path = cached
+            print(f"✅ Found IGED at: {cached}")
+            return
+        
         possible_paths = [
             Path("../launcher.py"),  # Parent directory
             Path("launcher.py"),     # Current directory
@@ -50,33 +108,104 @@ class SecureIGEDLauncher:
             if path.exists():
                 self.iged_path = path
                 print(f"✅ Found IGED at: {path.absolute()}")
+                self._write_cached_path(path.resolve())
                 return
         
         print("❌ IGED launcher not found")
         print("💡 Please ensure IGED is installed in a parent directory")
         self.iged_path = None
     
+    def biometric_available(self) -> bool:
+        """Check biometric hardware availability, querying the OS only once"""
+        if self._biometric_ok is None:
+            self._biometric_ok = _load_biometric_modules() and check_biometric_availability()
+        return self._biometric_ok
+    
+    def invalidate_availability(self):
+        """Forget the cached availability, e.g. after hardware is attached or removed"""
+        self._biometric_ok = None
+    
+    def _read_cached_path(self) -> Optional[Path]:
+        """Return the IGED path remembered from a previous run in this directory, if any"""
+        try:
+            lines = LAUNCHER_CACHE_FILE.read_text(encoding='utf-8').splitlines()
+        except OSError:
+            return None
+        
+        # Another checkout's entry, an old single-line cache or an empty file is a miss
+        if len(lines) != 2 or lines[0] != str(Path.cwd().resolve()) or not lines[1].strip():
+            return None
+        
+        cached = Path(lines[1].strip())
+        if cached.name != 'launcher.py' or not cached.is_file():
+            return None
+        return cached
+    
+    def _write_cached_path(self, path: Path):
+        """Remember the IGED path for the next run"""
+        try:
+            LAUNCHER_CACHE_FILE.parent.mkdir(exist_ok=True)
+            LAUNCHER_CACHE_FILE.write_text(f"{Path.cwd().resolve()}\n{path}", encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️ Could not cache IGED location: {e}")
+    
+    def invalidate_cached_path(self):
+        """Forget the remembered IGED path"""
+        try:
+            LAUNCHER_CACHE_FILE.unlink()
+        except OSError:
+            pass
+    
     def check_lockout(self) -> bool:
         """Check if account is locked out due to failed attempts"""
-        if self.auth_attempts >= self.max_attempts:
-            time_since_last = time.time() - self.last_failed_attempt
-            if time_since_last < self.lockout_duration:
-                remaining = int(self.lockout_duration - time_since_last)
+        if self.hit_count >= self.lockout_threshold:
+            time_since_last = time.monotonic() - self.last_failed_attempt
+            if time_since_last < self.backoff:
+                remaining = int(self.backoff - time_since_last)
                 print(f"🔒 Account locked out. Try again in {remaining} seconds")
                 return True
             else:
-                # Reset lockout
-                self.auth_attempts = 0
+                # Allow another attempt; the count is kept so a further failure locks longer
                 print("🔓 Lockout period expired")
         
         return False
     
+    def record_failure(self, weight: float = 1.0):
+        """Record a failed attempt
+        
+        Args:
+            weight: How much the failure counts towards lockout. Biometric
+                failures count 1.0; secret-based paths (PIN, password) can
+                weight guesses of popular values higher.
+        """
+        self.auth_attempts += 1
+        self.hit_count += weight
+        self.last_failed_attempt = time.monotonic()
+        # Per-attempt delay of 2**attempts seconds, so retries can't be scripted back to back
+        self._next_allowed_at = self.last_failed_attempt + min(1 << self.auth_attempts, self.lockout_duration)
+        
+        if self.hit_count >= self.lockout_threshold:
+            self.backoff = min(self.backoff_base * 2 ** (self.auth_attempts - 1), self.lockout_duration)
+            print(f"🔒 Account locked for {int(self.backoff)} seconds")
+    
+    def record_success(self):
+        """Reset failure accounting after a successful authentication"""
+        self.auth_attempts = 0
+        self.hit_count = 0.0
+        self.backoff = 0.0
+        self._next_allowed_at = 0.0
+    
     def authenticate_user(self) -> bool:
         """Authenticate user using biometrics"""
-        if not BIOMETRIC_AVAILABLE:
+        if not _load_biometric_modules():
             print("❌ Biometric authentication not available")
             return False
         
+        wait = self._next_allowed_at - time.monotonic()
+        if wait > 0:
+            print(f"⏳ Too many attempts. Try again in {int(wait) + 1} seconds")
+            return False
+        
         if self.check_lockout():
             return False
         
@@ -84,7 +213,7 @@ class SecureIGEDLauncher:
         print("👆 Please use your fingerprint or face to authenticate")
         
         # Check hardware availability
-        if not check_biometric_availability():
+        if not self.biometric_available():
             print("❌ No biometric hardware available")
             print("💡 Please configure Windows Hello or use alternative authentication")
             return False
@@ -94,16 +223,11 @@ class SecureIGEDLauncher:
         
         if success:
             print("✅ Biometric authentication successful!")
-            self.auth_attempts = 0  # Reset failed attempts
+            self.record_success()
             return True
         else:
             print("❌ Biometric authentication failed")
-            self.auth_attempts += 1
-            self.last_failed_attempt = time.time()
-            
-            if self.auth_attempts >= self.max_attempts:
-                print(f"🔒 Account locked for {self.lockout_duration} seconds")
-            
+            self.record_failure()
             return False
     
     def launch_iged(self) -> bool:
@@ -116,25 +240,42 @@ class SecureIGEDLauncher:
             print("🚀 Launching IGED...")
             
             # Launch IGED in a new process
-            self.iged_process = subprocess.Popen([
-                sys.executable, str(self.iged_path)
-            ], cwd=self.iged_path.parent)
+            self.iged_process = self._spawn_iged()
             
             print(f"✅ IGED launched successfully (PID: {self.iged_process.pid})")
             return True
             
+        except OSError as e:
+            # The cached location may be stale; probe again on the next run
+            self.invalidate_cached_path()
+            print(f"❌ Failed to launch IGED: {e}")
+            return False
         except Exception as e:
             print(f"❌ Failed to launch IGED: {e}")
             return False
     
+    def _spawn_iged(self):
+        """Start the IGED process, preferring posix_spawn over fork+exec"""
+        script = self.iged_path.resolve()
+        argv = [sys.executable, str(script)]
+        
+        # posix_spawn skips copying the parent's page tables (Qt may be loaded),
+        # but has no chdir action, so it is only used when IGED's directory is
+        # already our working directory
+        if hasattr(os, "posix_spawn") and script.parent == Path.cwd().resolve():
+            return SpawnedProcess(os.posix_spawn(sys.executable, argv, os.environ))
+        
+        # The launcher holds no descriptors the child must not see; skipping
+        # close_fds avoids a close() sweep up to RLIMIT_NOFILE in the child
+        close_fds = sys.platform == "win32"
+        return subprocess.Popen(argv, cwd=script.parent, close_fds=close_fds)
+    
     def show_gui_authentication(self) -> bool:
         """Show GUI authentication dialog"""
-        if not BIOMETRIC_AVAILABLE:
+        if not _load_biometric_modules():
             return False
         
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
+        _get_qapp()
         
         # Create progress dialog
         progress = QProgressDialog("Authenticating with Windows Hello...", "Cancel", 0, 0)
@@ -143,33 +284,33 @@ class SecureIGEDLauncher:
         progress.setMinimumDuration(0)
         progress.setValue(0)
         
-        # Set up timer to check authentication
-        auth_result = [None]
-        
-        def check_auth():
-            try:
-                if check_biometric_availability():
-                    success = biometric_authenticate_sync("Authenticate to unlock IGED")
-                    auth_result[0] = success
-                else:
-                    auth_result[0] = False
-            except Exception as e:
-                auth_result[0] = False
-                print(f"Authentication error: {e}")
-            finally:
-                progress.close()
-        
-        # Run authentication in separate thread
-        auth_thread = threading.Thread(target=check_auth)
+        launcher = self
+        
+        # Worker thread for the blocking Windows Hello calls; it never touches widgets
+        class AuthThread(QThread):
+            def __init__(self):
+                super().__init__()
+                self.result = False
+            
+            def run(self):
+                try:
+                    if launcher.biometric_available():
+                        self.result = biometric_authenticate_sync("Authenticate to unlock IGED")
+                except Exception as e:
+                    print(f"Authentication error: {e}")
+        
+        # finished is delivered to the GUI thread, so the dialog is closed there
+        auth_thread = AuthThread()
+        auth_thread.finished.connect(progress.close)
         auth_thread.start()
         
         # Show progress dialog
         progress.exec()
         
-        # Wait for authentication to complete
-        auth_thread.join()
+        # Only blocks if the dialog was cancelled while the prompt is still open
+        auth_thread.wait()
         
-        return auth_result[0] if auth_result[0] is not None else False
+        return bool(auth_thread.result)
     
     def run(self) -> bool:
         """Main launcher execution"""
@@ -185,7 +326,7 @@ class SecureIGEDLauncher:
         print("🔐 Starting biometric authentication...")
         
         # Try GUI authentication first
-        if BIOMETRIC_AVAILABLE:
+        if _load_biometric_modules():
             success = self.show_gui_authentication()
         else:
             success = self.authenticate_user()
@@ -206,12 +347,29 @@ class SecureIGEDLauncher:
             print("🔒 IGED will not start without successful authentication")
             return False
 
+_qapp = None
+
+def _has_display() -> bool:
+    """Check whether a GUI can be shown (skips Qt plugin loading when headless)"""
+    return sys.platform == 'win32' or bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+def _get_qapp():
+    """Return the process-wide QApplication, creating it once"""
+    global _qapp
+    if _qapp is None:
+        _qapp = QApplication.instance() or QApplication(sys.argv)
+    return _qapp
+
 def show_error_dialog(message: str):
     """Show error dialog"""
+    if not _has_display():
+        print(f"❌ {message}")
+        return
+    
     try:
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
+        if not _load_biometric_modules():
+            raise ImportError("Qt not available")
+        _get_qapp()
         
         msg_box = QMessageBox()
         msg_box.setIcon(QMessageBox.Critical)
@@ -226,10 +384,14 @@ def show_error_dialog(message: str):
 
 def show_success_dialog():
     """Show success dialog"""
+    if not _has_display():
+        print("✅ Authentication successful. IGED is now launching...")
+        return
+    
     try:
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
+        if not _load_biometric_modules():
+            return
+        _get_qapp()
         
         msg_box = QMessageBox()
         msg_box.setIcon(QMessageBox.Information)
@@ -247,7 +409,7 @@ def main():
     print("=" * 40)
     
     # Check dependencies
-    if not BIOMETRIC_AVAILABLE:
+    if not _load_biometric_modules():
         print("⚠️ Biometric authentication not available")
         print("💡 Install dependencies: pip install pywinrt PySide6")
         print("🔑 Proceeding with basic authentication...")
@@ -267,6 +429,10 @@ def main():
             sys.exit(1)
         return
     
+    # One QApplication serves the auth dialog and the result dialogs
+    if _has_display():
+        _get_qapp()
+    
     # Run secure launcher
     launcher = SecureIGEDLauncher()
     success = launcher.run()
@@ -0,0 +1,11 @@
+"""
+Shared pytest setup for the IGED biometric suite
+"""
+
+import sys
+from pathlib import Path
+
+# The modules import each other as top-level names (utils.logger, windows_hello)
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+if str(PACKAGE_DIR) not in sys.path:
+    sys.path.insert(0, str(PACKAGE_DIR))
@@ -0,0 +1,142 @@
+"""
+Tests for utils.crypto_utils: Fernet round trips and secure backups
+"""
+
+import base64
+import hashlib
+import json
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from cryptography.fernet import Fernet
+
+from utils import crypto_utils
+from utils.crypto_utils import CryptoManager, create_secure_backup, restore_secure_backup
+
+# Fixed key whose pre-2.0 fingerprint is computable, so v1 fixtures are deterministic
+FIXED_KEY = base64.urlsafe_b64encode(b'A' * 32)
+
+CREDENTIALS = {
+    'alice': {'user': {'name': 'Alice'}, 'credentials': [{'id': 'abc', 'sign_count': 3}]},
+    'bob': {'user': {'name': 'Bob'}, 'credentials': []},
+}
+
+@pytest.fixture
+def crypto(tmp_path, monkeypatch):
+    """A CryptoManager on a fixed key, also used by the module-level backup helpers"""
+    key_file = tmp_path / "secret.key"
+    key_file.write_bytes(FIXED_KEY)
+    manager = CryptoManager(key_file=key_file)
+    assert manager.initialized
+    monkeypatch.setattr(crypto_utils, "_default_crypto", manager)
+    return manager
+
+def _baseline_fingerprint(manager: CryptoManager) -> str:
+    """Key fingerprint exactly as version 1.0.0 backups recorded it"""
+    key = base64.urlsafe_b64decode(manager.fernet._encryption_key + b'=')
+    return hashlib.sha256(key).hexdigest()[:16]
+
+def _write_v1_backup(path, manager: CryptoManager, credentials, fingerprint):
+    """Write a backup in the single-envelope 1.0.0 layout with a double-encoded token"""
+    payload = json.dumps(credentials).encode('utf-8')
+    legacy_token = base64.b64encode(manager.fernet.encrypt(payload)).decode('utf-8')
+    backup_data = {
+        'timestamp': '2024-01-01T00:00:00',
+        'version': '1.0.0',
+        'encrypted_credentials': legacy_token,
+        'key_fingerprint': fingerprint
+    }
+    path.write_text(json.dumps(backup_data, indent=2), encoding='utf-8')
+
+class TestSymmetricEncryption:
+    """Test Fernet encryption and decryption."""
+
+    def test_round_trip(self, crypto):
+        """Test that decrypt_data inverts encrypt_data."""
+        token = crypto.encrypt_data("Hello, IGED!")
+        assert token.startswith('g')
+        assert crypto.decrypt_data(token) == "Hello, IGED!"
+
+    def test_round_trip_bytes_and_unicode(self, crypto):
+        """Test bytes input and non-ASCII text."""
+        assert crypto.decrypt_data(crypto.encrypt_data(b"raw bytes")) == "raw bytes"
+        assert crypto.decrypt_data(crypto.encrypt_data("clé 🔐")) == "clé 🔐"
+
+    def test_legacy_double_encoded_token(self, crypto):
+        """Test that tokens from before the single-encoding change still decrypt."""
+        legacy = base64.b64encode(crypto.fernet.encrypt(b"legacy secret")).decode('utf-8')
+        assert legacy.startswith('Z')
+        assert crypto.decrypt_data(legacy) == "legacy secret"
+
+    def test_wrong_key_fails(self, crypto):
+        """Test that a token from another key is rejected."""
+        other = Fernet(Fernet.generate_key()).encrypt(b"secret").decode('ascii')
+        assert crypto.decrypt_data(other) is None
+
+    def test_credentials_round_trip(self, crypto):
+        """Test encrypt_credentials and decrypt_credentials."""
+        token = crypto.encrypt_credentials(CREDENTIALS)
+        assert crypto.decrypt_credentials(token) == CREDENTIALS
+
+class TestSecureBackup:
+    """Test backup creation and restoration across formats."""
+
+    def test_v2_round_trip(self, crypto, tmp_path):
+        """Test that a 2.0.0 backup restores the original credentials."""
+        backup_path = tmp_path / "backup.json"
+        assert create_secure_backup(CREDENTIALS, backup_path)
+
+        lines = backup_path.read_text(encoding='utf-8').splitlines()
+        header = json.loads(lines[0])
+        assert header['version'] == crypto_utils.BACKUP_FORMAT_VERSION
+        assert header['key_fingerprint'] == crypto.get_key_fingerprint()
+        assert len(lines) == 1 + len(CREDENTIALS)
+
+        assert restore_secure_backup(backup_path) == CREDENTIALS
+
+    def test_v2_empty_credentials(self, crypto, tmp_path):
+        """Test a backup with no entries."""
+        backup_path = tmp_path / "backup.json"
+        assert create_secure_backup({}, backup_path)
+        assert restore_secure_backup(backup_path) == {}
+
+    def test_failed_backup_keeps_previous(self, crypto, tmp_path, monkeypatch):
+        """Test that a failure midway leaves the last good backup in place."""
+        backup_path = tmp_path / "backup.json"
+        assert create_secure_backup(CREDENTIALS, backup_path)
+        previous = backup_path.read_bytes()
+
+        monkeypatch.setattr(crypto, "encrypt_credentials", lambda credentials: None)
+        assert not create_secure_backup({'carol': {}}, backup_path)
+
+        assert backup_path.read_bytes() == previous
+        assert not backup_path.with_name(backup_path.name + '.tmp').exists()
+
+    def test_v1_backup_with_legacy_fingerprint(self, crypto, tmp_path):
+        """Test restoring a 1.0.0 backup written with the old fingerprint scheme."""
+        backup_path = tmp_path / "backup_v1.json"
+        _write_v1_backup(backup_path, crypto, CREDENTIALS, _baseline_fingerprint(crypto))
+        assert restore_secure_backup(backup_path) == CREDENTIALS
+
+    def test_v1_backup_with_current_fingerprint(self, crypto, tmp_path):
+        """Test restoring a 1.0.0 envelope that carries the current fingerprint."""
+        backup_path = tmp_path / "backup_v1.json"
+        _write_v1_backup(backup_path, crypto, CREDENTIALS, crypto.get_key_fingerprint())
+        assert restore_secure_backup(backup_path) == CREDENTIALS
+
+    def test_fingerprint_mismatch(self, crypto, tmp_path):
+        """Test that backups from another key are refused."""
+        v1_path = tmp_path / "backup_v1.json"
+        _write_v1_backup(v1_path, crypto, CREDENTIALS, "0000000000000000")
+        assert restore_secure_backup(v1_path) is None
+
+        v2_path = tmp_path / "backup_v2.json"
+        assert create_secure_backup(CREDENTIALS, v2_path)
+        lines = v2_path.read_text(encoding='utf-8').splitlines()
+        header = json.loads(lines[0])
+        header['key_fingerprint'] = "0000000000000000"
+        lines[0] = json.dumps(header)
+        v2_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        assert restore_secure_backup(v2_path) is None
@@ -0,0 +1,128 @@
+"""
+Tests for iged_launcher: failure accounting, lockout timing and the path cache
+"""
+
+import pytest
+
+import iged_launcher
+from iged_launcher import SecureIGEDLauncher
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the launcher's monotonic clock"""
+    fake = FakeClock()
+    monkeypatch.setattr(iged_launcher.time, "monotonic", fake)
+    return fake
+
+@pytest.fixture
+def launcher(tmp_path, monkeypatch, clock):
+    """A launcher whose installation lookup stays inside tmp_path"""
+    monkeypatch.setattr(iged_launcher, "LAUNCHER_CACHE_FILE", tmp_path / ".iged" / "launcher.cache")
+    monkeypatch.chdir(tmp_path)
+    return SecureIGEDLauncher()
+
+class TestFailureAccounting:
+    """Test record_failure / record_success timing."""
+
+    def test_per_attempt_delay_doubles(self, launcher, clock):
+        """Test the 2**attempts retry delay before the lockout threshold."""
+        launcher.record_failure()
+        assert launcher._next_allowed_at == clock.now + 2
+        assert not launcher.check_lockout()
+
+        launcher.record_failure()
+        assert launcher._next_allowed_at == clock.now + 4
+        assert not launcher.check_lockout()
+
+    def test_lockout_after_threshold(self, launcher, clock):
+        """Test that the third failure locks for backoff_base * 2**(attempts - 1)."""
+        for _ in range(launcher.max_attempts):
+            launcher.record_failure()
+
+        assert launcher.backoff == launcher.backoff_base * 4
+        clock.now += launcher.backoff - 1
+        assert launcher.check_lockout()
+        clock.now += 1
+        assert not launcher.check_lockout()
+
+    def test_backoff_doubles_and_caps(self, launcher, clock):
+        """Test that each further failure doubles the lockout up to lockout_duration."""
+        for _ in range(launcher.max_attempts):
+            launcher.record_failure()
+
+        launcher.record_failure()
+        assert launcher.backoff == launcher.backoff_base * 8
+
+        launcher.record_failure()
+        assert launcher.backoff == launcher.lockout_duration
+
+        for _ in range(5):
+            launcher.record_failure()
+        assert launcher.backoff == launcher.lockout_duration
+        assert launcher._next_allowed_at == clock.now + launcher.lockout_duration
+
+    def test_weighted_failure(self, launcher):
+        """Test that a heavy failure reaches the threshold on its own."""
+        launcher.record_failure(weight=launcher.lockout_threshold)
+        assert launcher.backoff == launcher.backoff_base
+        assert launcher.check_lockout()
+
+    def test_success_resets(self, launcher, clock):
+        """Test that record_success clears counters, backoff and retry delay."""
+        for _ in range(launcher.max_attempts):
+            launcher.record_failure()
+
+        launcher.record_success()
+        assert launcher.auth_attempts == 0
+        assert launcher.hit_count == 0.0
+        assert launcher.backoff == 0.0
+        assert launcher._next_allowed_at == 0.0
+        assert not launcher.check_lockout()
+
+        launcher.record_failure()
+        assert launcher._next_allowed_at == clock.now + 2
+
+class TestInstallationCache:
+    """Test the remembered IGED launcher path."""
+
+    def test_cache_is_keyed_by_directory(self, tmp_path, monkeypatch):
+        """Test that a cached path from another checkout is not reused."""
+        monkeypatch.setattr(iged_launcher, "LAUNCHER_CACHE_FILE", tmp_path / "launcher.cache")
+        for checkout in ("a", "b"):
+            (tmp_path / checkout).mkdir()
+            (tmp_path / checkout / "launcher.py").touch()
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert SecureIGEDLauncher().iged_path.resolve() == (tmp_path / "a" / "launcher.py").resolve()
+
+        monkeypatch.chdir(tmp_path / "b")
+        assert SecureIGEDLauncher().iged_path.resolve() == (tmp_path / "b" / "launcher.py").resolve()
+
+    def test_empty_cache_is_ignored(self, tmp_path, monkeypatch):
+        """Test that an empty cache file does not resolve to the working directory."""
+        cache_file = tmp_path / "launcher.cache"
+        cache_file.write_text(f"{tmp_path.resolve()}\n  ", encoding='utf-8')
+        monkeypatch.setattr(iged_launcher, "LAUNCHER_CACHE_FILE", cache_file)
+        monkeypatch.chdir(tmp_path)
+
+        assert SecureIGEDLauncher().iged_path is None
+
+    def test_cache_must_name_launcher_file(self, tmp_path, monkeypatch):
+        """Test that a cached path to anything but launcher.py is rejected."""
+        other = tmp_path / "other.py"
+        other.touch()
+        cache_file = tmp_path / "launcher.cache"
+        cache_file.write_text(f"{tmp_path.resolve()}\n{other}", encoding='utf-8')
+        monkeypatch.setattr(iged_launcher, "LAUNCHER_CACHE_FILE", cache_file)
+        monkeypatch.chdir(tmp_path)
+
+        assert SecureIGEDLauncher().iged_path is None
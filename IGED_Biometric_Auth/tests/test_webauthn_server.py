@@ -0,0 +1,140 @@
+"""
+Tests for webauthn_server: single-use sessions and the /batch endpoint
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("fido2")
+pytest.importorskip("flask")
+
+import webauthn_server
+from webauthn_server import WebAuthnServer
+
+BOGUS_REGISTRATION = {'clientDataJSON': 'AA', 'attestationObject': 'AA'}
+BOGUS_ASSERTION = {'clientDataJSON': 'AA', 'authenticatorData': 'AA', 'signature': 'AA'}
+
+class FakeRedis:
+    """Just enough of redis.Redis for the session store"""
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+class FakePipeline:
+    """Queues commands and runs them as one unit, like MULTI/EXEC"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def get(self, key):
+        self.commands.append(lambda: self.redis.data.get(key))
+
+    def delete(self, key):
+        self.commands.append(lambda: int(self.redis.data.pop(key, None) is not None))
+
+    def execute(self):
+        with self.redis.lock:
+            return [command() for command in self.commands]
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """A WebAuthnServer whose credential store lives in tmp_path"""
+    monkeypatch.setattr(webauthn_server, "CREDENTIALS_FILE", tmp_path / "webauthn_credentials.json")
+    return WebAuthnServer()
+
+def _pending(kind_data):
+    """Session payload stamped with the current time, as the begin handlers store it"""
+    return dict(kind_data, created=time.monotonic())
+
+class TestSessionConsumption:
+    """Test that a pending ceremony can be completed at most once."""
+
+    def test_take_session_once(self, server):
+        """Test that the second take of a session finds nothing."""
+        server._store_session('authentication', 'sid', _pending({'state': {}, 'user_id': 'u1'}))
+        assert server._take_session('authentication', 'sid')['user_id'] == 'u1'
+        assert server._take_session('authentication', 'sid') is None
+        assert 'sid' not in server._auth_expiry
+
+    def test_concurrent_takes(self, server):
+        """Test that only one of many racing threads gets the session."""
+        server._store_session('registration', 'sid', _pending({'state': {}, 'user': {'id': 'u1'}}))
+        results = []
+        barrier = threading.Barrier(8)
+
+        def take():
+            barrier.wait()
+            results.append(server._take_session('registration', 'sid'))
+
+        threads = [threading.Thread(target=take) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(result is not None for result in results) == 1
+
+    def test_failed_completion_consumes_session(self, server):
+        """Test that a rejected response cannot be retried against the same session."""
+        server._store_session('registration', 'reg', _pending({'state': {}, 'user': {'id': 'u1'}}))
+        assert 'error' in server.register_complete('reg', BOGUS_REGISTRATION)
+        assert server.register_complete('reg', BOGUS_REGISTRATION) == {'error': 'Invalid session ID'}
+
+        server._store_session('authentication', 'auth', _pending({'state': {}, 'user_id': 'u1'}))
+        assert 'error' in server.authenticate_complete('auth', BOGUS_ASSERTION)
+        assert server.authenticate_complete('auth', BOGUS_ASSERTION) == {'error': 'Invalid session ID'}
+
+    def test_redis_take_session_once(self, server):
+        """Test the Redis store reads and deletes a session in one transaction."""
+        server._redis = FakeRedis()
+        server._store_session('authentication', 'sid', _pending({'state': {}, 'user_id': 'u1'}))
+        assert server._take_session('authentication', 'sid')['user_id'] == 'u1'
+        assert server._take_session('authentication', 'sid') is None
+        assert server._redis.data == {}
+
+class TestBatchEndpoint:
+    """Test /batch request validation."""
+
+    @pytest.fixture
+    def client(self):
+        """Flask test client for the module-level app"""
+        return webauthn_server.app.test_client()
+
+    @pytest.mark.parametrize("body", [[], "x", 3, {}, {'requests': {}}, {'requests': [1]},
+                                      {'requests': [{'url': '/authenticate'}, "x"]}])
+    def test_malformed_body(self, client, body):
+        """Test that bodies of the wrong shape are client errors."""
+        response = client.post('/batch', json=body)
+        assert response.status_code == 400
+
+    def test_invalid_json(self, client):
+        """Test that an unparseable body is a client error."""
+        response = client.post('/batch', data='not json', content_type='application/json')
+        assert response.status_code == 400
+
+    def test_too_many_requests(self, client):
+        """Test the per-batch request limit."""
+        body = {'requests': [{'url': '/authenticate'}] * (webauthn_server.MAX_BATCH_REQUESTS + 1)}
+        assert client.post('/batch', json=body).status_code == 400
+
+    def test_per_request_status(self, client):
+        """Test that each sub-request reports its own status."""
+        body = {'requests': [
+            {'id': 1, 'url': ['not', 'a', 'string']},
+            {'id': 2, 'url': '/authenticate'},
+            {'id': 3, 'url': '/authenticate', 'body': {'user_id': 'nobody'}},
+        ]}
+        response = client.post('/batch', json=body)
+        assert response.status_code == 200
+        statuses = {item['id']: item['status'] for item in response.get_json()['responses']}
+        assert statuses == {1: 404, 2: 400, 3: 400}
@@ -8,16 +8,17 @@ import os
 import base64
 import hashlib
 import secrets
+import hmac
 import json
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime, timedelta
 
 try:
     from cryptography.fernet import Fernet
     from cryptography.hazmat.primitives import hashes, serialization
     from cryptography.hazmat.primitives.asymmetric import rsa, padding
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
     from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
     from cryptography.hazmat.backends import default_backend
     CRYPTOGRAPHY_AVAILABLE = True
@@ -25,15 +26,52 @@ except ImportError:
     print("⚠️ Cryptography library not available")
     CRYPTOGRAPHY_AVAILABLE = False
 
+# Optional fast JSON codec; stdlib json is used when missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional SIMD-accelerated BLAKE3 hashing
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Every Fernet token starts with version byte 0x80, i.e. "g" in base64;
+# tokens from before encrypt_data stopped double-encoding start with "Z"
+FERNET_TOKEN_PREFIX = b'g'
+
 class CryptoManager:
     """Manages cryptographic operations for IGED biometric authentication"""
     
     def __init__(self, key_file: Optional[Path] = None):
         self.key_file = key_file or Path("config/secret.key")
+        self.rsa_key_file = self.key_file.parent / "rsa_private.pem"
         self.fernet = None
         self.rsa_private_key = None
         self.rsa_public_key = None
         self.initialized = False
+        self._key_fingerprint = None
+        self._legacy_key_fingerprint = None
+        
+        # Padding schemes are immutable; build them once and reuse per operation
+        self._oaep = None
+        self._pss = None
+        self._sha256 = None
+        if CRYPTOGRAPHY_AVAILABLE:
+            self._oaep = padding.OAEP(
+                mgf=padding.MGF1(algorithm=hashes.SHA256()),
+                algorithm=hashes.SHA256(),
+                label=None
+            )
+            self._pss = padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH
+            )
+            self._sha256 = hashes.SHA256()
         
         # Initialize cryptography
         self._initialize_crypto()
@@ -58,24 +96,51 @@ class CryptoManager:
                     f.write(key)
                 self.fernet = Fernet(key)
             
-            # Generate RSA key pair for asymmetric operations
-            self._generate_rsa_keys()
+            # Fingerprint the key once; it never changes for this instance
+            raw_key = base64.urlsafe_b64decode(key)
+            self._key_fingerprint = hashlib.sha256(raw_key).hexdigest()[:16]
+            self._legacy_key_fingerprint = self._compute_legacy_fingerprint(raw_key)
             
+            # The RSA key pair is set up lazily by _ensure_rsa_keys
             self.initialized = True
             print("✅ Cryptographic manager initialized")
             
         except Exception as e:
             print(f"❌ Failed to initialize cryptography: {e}")
     
+    def _ensure_rsa_keys(self):
+        """Set up the RSA key pair on first asymmetric use"""
+        if self.rsa_private_key is None and self.rsa_public_key is None:
+            self._generate_rsa_keys()
+    
     def _generate_rsa_keys(self):
-        """Generate RSA key pair"""
+        """Load the persisted RSA key pair, generating and saving it on first use"""
         try:
-            # Generate private key
-            self.rsa_private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=2048,
-                backend=default_backend()
-            )
+            if self.rsa_key_file.exists():
+                with open(self.rsa_key_file, 'rb') as f:
+                    self.rsa_private_key = serialization.load_pem_private_key(
+                        f.read(),
+                        password=None,
+                        backend=default_backend()
+                    )
+            else:
+                # Generate private key
+                self.rsa_private_key = rsa.generate_private_key(
+                    public_exponent=65537,
+                    key_size=2048,
+                    backend=default_backend()
+                )
+                
+                # Persist it (owner-only) so later processes share the same key pair
+                pem = self.rsa_private_key.private_bytes(
+                    encoding=serialization.Encoding.PEM,
+                    format=serialization.PrivateFormat.PKCS8,
+                    encryption_algorithm=serialization.NoEncryption()
+                )
+                self.rsa_key_file.parent.mkdir(exist_ok=True)
+                fd = os.open(self.rsa_key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(pem)
             
             # Get public key
             self.rsa_public_key = self.rsa_private_key.public_key()
@@ -92,8 +157,8 @@ class CryptoManager:
             if isinstance(data, str):
                 data = data.encode('utf-8')
             
-            encrypted = self.fernet.encrypt(data)
-            return base64.b64encode(encrypted).decode('utf-8')
+            # Fernet tokens are already URL-safe base64
+            return self.fernet.encrypt(data).decode('ascii')
             
         except Exception as e:
             print(f"❌ Encryption failed: {e}")
@@ -105,8 +170,11 @@ class CryptoManager:
             return None
         
         try:
-            encrypted_bytes = base64.b64decode(encrypted_data.encode('utf-8'))
-            decrypted = self.fernet.decrypt(encrypted_bytes)
+            token = encrypted_data.encode('ascii')
+            if not token.startswith(FERNET_TOKEN_PREFIX):
+                # Older blobs wrapped the Fernet token in a second base64 layer
+                token = base64.b64decode(token)
+            decrypted = self.fernet.decrypt(token)
             return decrypted.decode('utf-8')
             
         except Exception as e:
@@ -115,6 +183,8 @@ class CryptoManager:
     
     def encrypt_asymmetric(self, data: Union[str, bytes]) -> Optional[Dict[str, str]]:
         """Encrypt data using RSA public key"""
+        if self.initialized:
+            self._ensure_rsa_keys()
         if not self.initialized or not self.rsa_public_key:
             return None
         
@@ -124,15 +194,11 @@ class CryptoManager:
             
             encrypted = self.rsa_public_key.encrypt(
                 data,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
+                self._oaep
             )
             
             return {
-                'encrypted_data': base64.b64encode(encrypted).decode('utf-8'),
+                'encrypted_data': base64.b64encode(encrypted).decode('ascii'),
                 'algorithm': 'RSA-OAEP-SHA256'
             }
             
@@ -142,18 +208,16 @@ class CryptoManager:
     
     def decrypt_asymmetric(self, encrypted_data: str) -> Optional[str]:
         """Decrypt data using RSA private key"""
+        if self.initialized:
+            self._ensure_rsa_keys()
         if not self.initialized or not self.rsa_private_key:
             return None
         
         try:
-            encrypted_bytes = base64.b64decode(encrypted_data.encode('utf-8'))
+            encrypted_bytes = base64.b64decode(encrypted_data.encode('ascii'))
             decrypted = self.rsa_private_key.decrypt(
                 encrypted_bytes,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
+                self._oaep
             )
             
             return decrypted.decode('utf-8')
@@ -174,6 +238,11 @@ class CryptoManager:
                 hash_obj = hashlib.sha512(data)
             elif algorithm.lower() == 'md5':
                 hash_obj = hashlib.md5(data)
+            elif algorithm.lower() == 'blake3':
+                if not BLAKE3_AVAILABLE:
+                    print("❌ BLAKE3 not available. Install with: pip install blake3")
+                    return None
+                hash_obj = blake3.blake3(data)
             else:
                 print(f"❌ Unsupported hash algorithm: {algorithm}")
                 return None
@@ -184,28 +253,49 @@ class CryptoManager:
             print(f"❌ Hashing failed: {e}")
             return None
     
+    def hash_file(self, file_path: Path, algorithm: str = 'sha256') -> Optional[str]:
+        """Hash a file without reading it into memory"""
+        try:
+            with open(file_path, 'rb') as f:
+                if algorithm.lower() == 'blake3':
+                    if not BLAKE3_AVAILABLE:
+                        print("❌ BLAKE3 not available. Install with: pip install blake3")
+                        return None
+                    hash_obj = blake3.blake3()
+                elif hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: the read loop runs in C (SHA-NI applies for sha256)
+                    return hashlib.file_digest(f, algorithm.lower()).hexdigest()
+                else:
+                    hash_obj = hashlib.new(algorithm.lower())
+                
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hash_obj.update(chunk)
+                return hash_obj.hexdigest()
+            
+        except Exception as e:
+            print(f"❌ File hashing failed: {e}")
+            return None
+    
     def generate_secure_token(self, length: int = 32) -> str:
-        """Generate a secure random token"""
-        return secrets.token_urlsafe(length)
+        """Generate a URL-safe random token carrying length bytes of randomness"""
+        return base64.urlsafe_b64encode(secrets.token_bytes(length)).rstrip(b'=').decode('ascii')
+    
+    def generate_secure_tokens(self, count: int, length: int = 32) -> List[str]:
+        """Generate several tokens from a single read of the OS random source"""
+        pool = secrets.token_bytes(count * length)
+        return [
+            base64.urlsafe_b64encode(pool[i:i + length]).rstrip(b'=').decode('ascii')
+            for i in range(0, len(pool), length)
+        ]
     
     def derive_key_from_password(self, password: str, salt: Optional[bytes] = None) -> Optional[bytes]:
         """Derive a key from password using PBKDF2"""
-        if not CRYPTOGRAPHY_AVAILABLE:
-            return None
-        
         try:
             if salt is None:
                 salt = os.urandom(16)
             
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-                backend=default_backend()
-            )
-            
-            key = kdf.derive(password.encode('utf-8'))
+            # OpenSSL's PBKDF2 runs the whole iteration loop in C (SHA-NI where available)
+            key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000, dklen=32)
             return key
             
         except Exception as e:
@@ -215,8 +305,12 @@ class CryptoManager:
     def encrypt_credentials(self, credentials: Dict[str, Any]) -> Optional[str]:
         """Encrypt credential data"""
         try:
-            # Convert to JSON
-            json_data = json.dumps(credentials, sort_keys=True)
+            # Convert to compact JSON; key order is irrelevant once encrypted
+            # (orjson yields bytes, which Fernet takes directly)
+            if ORJSON_AVAILABLE:
+                json_data = orjson.dumps(credentials, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                json_data = json.dumps(credentials, separators=(',', ':'))
             
             # Encrypt
             encrypted = self.encrypt_data(json_data)
@@ -235,7 +329,7 @@ class CryptoManager:
                 return None
             
             # Parse JSON
-            credentials = json.loads(decrypted)
+            credentials = orjson.loads(decrypted) if ORJSON_AVAILABLE else json.loads(decrypted)
             return credentials
             
         except Exception as e:
@@ -244,6 +338,8 @@ class CryptoManager:
     
     def sign_data(self, data: Union[str, bytes]) -> Optional[Dict[str, str]]:
         """Sign data using RSA private key"""
+        if self.initialized:
+            self._ensure_rsa_keys()
         if not self.initialized or not self.rsa_private_key:
             return None
         
@@ -253,15 +349,12 @@ class CryptoManager:
             
             signature = self.rsa_private_key.sign(
                 data,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
+                self._pss,
+                self._sha256
             )
             
             return {
-                'signature': base64.b64encode(signature).decode('utf-8'),
+                'signature': base64.b64encode(signature).decode('ascii'),
                 'algorithm': 'RSA-PSS-SHA256'
             }
             
@@ -271,6 +364,8 @@ class CryptoManager:
     
     def verify_signature(self, data: Union[str, bytes], signature: str) -> bool:
         """Verify signature using RSA public key"""
+        if self.initialized:
+            self._ensure_rsa_keys()
         if not self.initialized or not self.rsa_public_key:
             return False
         
@@ -278,16 +373,13 @@ class CryptoManager:
             if isinstance(data, str):
                 data = data.encode('utf-8')
             
-            signature_bytes = base64.b64decode(signature.encode('utf-8'))
+            signature_bytes = base64.b64decode(signature.encode('ascii'))
             
             self.rsa_public_key.verify(
                 signature_bytes,
                 data,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
+                self._pss,
+                self._sha256
             )
             
             return True
@@ -298,6 +390,8 @@ class CryptoManager:
     
     def export_public_key(self) -> Optional[str]:
         """Export RSA public key as PEM"""
+        if self.initialized:
+            self._ensure_rsa_keys()
         if not self.initialized or not self.rsa_public_key:
             return None
         
@@ -333,39 +427,75 @@ class CryptoManager:
         if not self.initialized or not self.fernet:
             return None
         
+        return self._key_fingerprint
+    
+    def matches_key_fingerprint(self, fingerprint: Optional[str]) -> bool:
+        """Check a stored fingerprint against the current key in constant time"""
+        if self._key_fingerprint is not None and fingerprint is not None:
+            if hmac.compare_digest(fingerprint.encode('utf-8'), self._key_fingerprint.encode('utf-8')):
+                return True
+        
+        # Backups written before fingerprints were precomputed used the old scheme
+        if self._legacy_key_fingerprint is None or fingerprint is None:
+            return fingerprint is None and self._legacy_key_fingerprint is None
+        return hmac.compare_digest(fingerprint.encode('utf-8'), self._legacy_key_fingerprint.encode('utf-8'))
+    
+    @staticmethod
+    def _compute_legacy_fingerprint(raw_key: bytes) -> Optional[str]:
+        """Fingerprint as computed by earlier versions (from Fernet's encryption half)"""
         try:
-            # Get the key and hash it
-            key = base64.urlsafe_b64decode(self.fernet._encryption_key + b'=')
-            return hashlib.sha256(key).hexdigest()[:16]
-            
-        except Exception as e:
-            print(f"❌ Key fingerprint generation failed: {e}")
+            return hashlib.sha256(base64.urlsafe_b64decode(raw_key[16:] + b'=')).hexdigest()[:16]
+        except ValueError:
             return None
 
+# Shared instance for module-level helpers
+_default_crypto: Optional[CryptoManager] = None
+_default_crypto_lock = threading.Lock()
+
+def get_crypto() -> CryptoManager:
+    """Get or create the shared CryptoManager instance"""
+    global _default_crypto
+    if _default_crypto is None:
+        with _default_crypto_lock:
+            if _default_crypto is None:
+                _default_crypto = CryptoManager()
+    return _default_crypto
+
+# Backup layout: a JSON header line, then one encrypted record per line
+BACKUP_FORMAT_VERSION = '2.0.0'
+
 def create_secure_backup(credentials: Dict[str, Any], backup_path: Path) -> bool:
     """Create a secure backup of credentials"""
     try:
-        crypto = CryptoManager()
+        crypto = get_crypto()
         if not crypto.initialized:
             return False
         
-        # Encrypt credentials
-        encrypted = crypto.encrypt_credentials(credentials)
-        if encrypted is None:
-            return False
-        
-        # Create backup data
-        backup_data = {
+        # Create backup header
+        header = {
             'timestamp': datetime.now().isoformat(),
-            'version': '1.0.0',
-            'encrypted_credentials': encrypted,
+            'version': BACKUP_FORMAT_VERSION,
             'key_fingerprint': crypto.get_key_fingerprint()
         }
         
-        # Save backup
+        # Save backup, encrypting and writing each entry as it is produced so
+        # peak memory is one entry rather than the whole serialized store.
+        # Entries go to a sibling temp file that only replaces the old backup once complete.
         backup_path.parent.mkdir(exist_ok=True)
-        with open(backup_path, 'w') as f:
-            json.dump(backup_data, f, indent=2)
+        tmp_path = backup_path.with_name(backup_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(header, separators=(',', ':')))
+                f.write('\n')
+                for key, value in credentials.items():
+                    encrypted = crypto.encrypt_credentials({key: value})
+                    if encrypted is None:
+                        return False
+                    f.write(encrypted)
+                    f.write('\n')
+            os.replace(tmp_path, backup_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
         
         return True
         
@@ -376,22 +506,41 @@ def create_secure_backup(credentials: Dict[str, Any], backup_path: Path) -> bool
 def restore_secure_backup(backup_path: Path) -> Optional[Dict[str, Any]]:
     """Restore credentials from secure backup"""
     try:
-        crypto = CryptoManager()
+        crypto = get_crypto()
         if not crypto.initialized:
             return None
         
-        # Load backup
-        with open(backup_path, 'r') as f:
-            backup_data = json.load(f)
-        
-        # Verify key fingerprint
-        if backup_data.get('key_fingerprint') != crypto.get_key_fingerprint():
-            print("❌ Key fingerprint mismatch - backup cannot be restored")
-            return None
-        
-        # Decrypt credentials
-        encrypted_credentials = backup_data['encrypted_credentials']
-        credentials = crypto.decrypt_credentials(encrypted_credentials)
+        with open(backup_path, 'r', encoding='utf-8') as f:
+            # Load backup header
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                header = None
+            
+            if header is None or 'encrypted_credentials' in header:
+                # Version 1 backups are a single JSON envelope
+                f.seek(0)
+                backup_data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
+                if not crypto.matches_key_fingerprint(backup_data.get('key_fingerprint')):
+                    print("❌ Key fingerprint mismatch - backup cannot be restored")
+                    return None
+                return crypto.decrypt_credentials(backup_data['encrypted_credentials'])
+            
+            # Verify key fingerprint
+            if not crypto.matches_key_fingerprint(header.get('key_fingerprint')):
+                print("❌ Key fingerprint mismatch - backup cannot be restored")
+                return None
+            
+            # Decrypt credentials record by record
+            credentials = {}
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = crypto.decrypt_credentials(line)
+                if record is None:
+                    return None
+                credentials.update(record)
         
         return credentials
         
@@ -6,12 +6,16 @@ Consistent logging across all biometric authentication components
 
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, Dict, Any
 import threading
+import time
+from collections import deque
 
 # Configure colorama for colored output
 try:
@@ -21,200 +25,465 @@ try:
 except ImportError:
     COLORAMA_AVAILABLE = False
 
+# Optional fast JSON serialization for audit records
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_iso_cache = (None, "")
+
+def _fast_iso(ts: float) -> str:
+    """Format an epoch timestamp like datetime.isoformat(), reusing the per-second prefix"""
+    global _iso_cache
+    second = int(ts)
+    cached_second, prefix = _iso_cache
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _iso_cache = (second, prefix)
+    return f"{prefix}.{int((ts - second) * 1e6):06d}"
+
+# Color escape codes resolved once; empty strings when colorama is missing
+_GREEN, _YELLOW, _RED, _CRIT_PREFIX, _RESET = (
+    (Fore.GREEN, Fore.YELLOW, Fore.RED, Fore.RED + Back.WHITE, Style.RESET_ALL)
+    if COLORAMA_AVAILABLE else ("", "", "", "", "")
+)
+
+class ColorFormatter(logging.Formatter):
+    """Console formatter that colors records by level"""
+    
+    LEVEL_COLORS = {
+        logging.INFO: _GREEN,
+        logging.WARNING: _YELLOW,
+        logging.ERROR: _RED,
+        logging.CRITICAL: _CRIT_PREFIX,
+    }
+    
+    def format(self, record):
+        return self.LEVEL_COLORS.get(record.levelno, "") + super().format(record) + _RESET
+
+# Records are handed to a background listener so callers never block on I/O
+LOG_QUEUE_SIZE = 10000
+AUDIT_RING_SIZE = 8192
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.1
+AUDIT_BATCH_SIZE = 256
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_log_routes: Dict[str, list] = {}
+_listeners: Dict[int, Any] = {}
+_listener_lock = threading.Lock()
+
+class RingBufferQueue:
+    """Bounded queue that discards the oldest record instead of blocking when full"""
+    
+    def __init__(self, maxlen: int):
+        self._items = deque(maxlen=maxlen)
+        self._ready = threading.Condition(threading.Lock())
+    
+    def put_nowait(self, item):
+        with self._ready:
+            self._items.append(item)
+            self._ready.notify()
+    
+    put = put_nowait
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        with self._ready:
+            while not self._items:
+                if not block or not self._ready.wait(timeout):
+                    raise queue.Empty
+            return self._items.popleft()
+    
+    def get_nowait(self):
+        return self.get(block=False)
+    
+    def drain(self, limit: int, timeout: Optional[float] = None) -> list:
+        """Pop up to limit items at once, waiting up to timeout for the first"""
+        with self._ready:
+            if not self._items:
+                self._ready.wait(timeout)
+            return [self._items.popleft() for _ in range(min(limit, len(self._items)))]
+    
+    def wake(self):
+        """Wake a consumer blocked in drain()"""
+        with self._ready:
+            self._ready.notify_all()
+
+_audit_queue = RingBufferQueue(AUDIT_RING_SIZE)
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+class _RouteHandler(logging.Handler):
+    """Listener-side handler that forwards records to their logger's real handlers"""
+    
+    def handle(self, record):
+        for handler in _log_routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def emit(self, record):
+        self.handle(record)
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that coalesces writes in a 64KB buffer instead of flushing per record"""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+class AppendFileHandler(logging.Handler):
+    """Handler that writes whole batches of lines to an O_APPEND file descriptor"""
+    
+    terminator = '\n'
+    
+    def __init__(self, filename, mode: int = 0o600):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        self.fd = os.open(self.baseFilename, flags, mode)
+    
+    def emit(self, record):
+        self.emit_batch([record])
+    
+    def _encode(self, record) -> bytes:
+        """Render one record as a terminated UTF-8 line"""
+        format_bytes = getattr(self.formatter, 'format_bytes', None)
+        if format_bytes is not None:
+            return format_bytes(record) + b'\n'
+        return (self.format(record) + self.terminator).encode('utf-8')
+    
+    def emit_batch(self, records: list):
+        """Format records and append them with a single write"""
+        try:
+            payload = memoryview(b"".join([self._encode(r) for r in records]))
+            self.acquire()
+            try:
+                while payload:
+                    payload = payload[os.write(self.fd, payload):]
+            finally:
+                self.release()
+        except Exception:
+            self.handleError(records[0])
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+        finally:
+            self.release()
+        super().close()
+
+def _flush_routes():
+    """Flush every routed handler so buffered lines reach disk"""
+    for handlers in list(_log_routes.values()):
+        for handler in handlers:
+            handler.flush()
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes buffered handlers whenever its queue goes idle"""
+    
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                if not block:
+                    raise
+                _flush_routes()
+
+class _BatchListener:
+    """Background thread that drains a RingBufferQueue and dispatches records in batches"""
+    
+    def __init__(self, ring: RingBufferQueue):
+        self.ring = ring
+        self._running = False
+        self._thread = None
+    
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="IGEDAuditWriter", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._running = False
+        self.ring.wake()
+        self._thread.join()
+    
+    def _run(self):
+        while True:
+            batch = self.ring.drain(AUDIT_BATCH_SIZE, LOG_FLUSH_INTERVAL)
+            if batch:
+                _dispatch_batch(batch)
+            elif not self._running:
+                break
+
+def _dispatch_batch(records: list):
+    """Send a batch to each routed handler, one write per batch-capable handler"""
+    batches: Dict[logging.Handler, list] = {}
+    for record in records:
+        for handler in _log_routes.get(record.name, ()):
+            if record.levelno < handler.level:
+                continue
+            if isinstance(handler, AppendFileHandler):
+                batches.setdefault(handler, []).append(record)
+            else:
+                handler.handle(record)
+    for handler, batch in batches.items():
+        handler.emit_batch(batch)
+
+def _start_listener(log_queue):
+    """Start one queue listener per queue for the life of the process"""
+    with _listener_lock:
+        if id(log_queue) not in _listeners:
+            if isinstance(log_queue, RingBufferQueue):
+                listener = _BatchListener(log_queue)
+            else:
+                listener = _FlushingQueueListener(log_queue, _RouteHandler())
+            listener.start()
+            atexit.register(listener.stop)
+            _listeners[id(log_queue)] = listener
+
+_MISSING = object()
+
+# Structured fields the audit API passes through extra=
+_AUDIT_FIELDS = ('user_id', 'event_type', 'ip_address', 'method', 'success',
+                 'operation', 'violation_type', 'severity', 'details')
+
+class JSONFormatter(logging.Formatter):
+    """Formatter that renders audit records as one JSON object per line"""
+    
+    def format(self, record):
+        return self.format_bytes(record).decode('utf-8')
+    
+    def format_bytes(self, record) -> bytes:
+        """Render the record as UTF-8 JSON without a str round trip"""
+        log_entry = {
+            'timestamp': _fast_iso(record.created),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno
+        }
+        
+        # Add extra fields if present
+        log_entry.update({key: value for key in _AUDIT_FIELDS
+                          if (value := getattr(record, key, _MISSING)) is not _MISSING})
+        
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_entry, default=str)
+        return json.dumps(log_entry, default=str).encode('utf-8')
+
+# Formatters are stateless, so every logger shares the same instances
+_CONSOLE_FORMATTER = ColorFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+)
+_JSON_FORMATTER = JSONFormatter()
+
+_SEVERITY_LEVELS = {"HIGH": logging.CRITICAL, "MEDIUM": logging.WARNING}
+
+_MKDIR_CACHE: set = set()
+
+def _ensure_dir(path: Path):
+    """Create a log directory once per process"""
+    if path not in _MKDIR_CACHE:
+        path.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(path)
+
 class IGEDLogger:
     """Unified logger for IGED biometric authentication"""
     
+    __slots__ = ('name', 'log_file', 'logger', '_handlers',
+                 '_log_debug', '_log_info', '_log_warning', '_log_error',
+                 '_log_critical', '_log')
+    
     def __init__(self, name: str, log_file: Optional[Path] = None):
-        self.name = name
-        self.log_file = log_file or Path("logs/iged_biometric.log")
-        self.logger = logging.getLogger(name)
+        self.name: str = name
+        self.log_file: Path = log_file or Path("logs/iged_biometric.log")
+        self.logger: logging.Logger = logging.getLogger(name)
         self._setup_logger()
     
     def _setup_logger(self):
         """Setup logger configuration"""
         # Create logs directory
-        self.log_file.parent.mkdir(exist_ok=True)
+        _ensure_dir(self.log_file.parent)
         
         # Set log level
         self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
         
-        # Clear existing handlers
-        self.logger.handlers.clear()
+        # Bind the logging calls once for the wrapper methods
+        self._log_debug = self.logger.debug
+        self._log_info = self.logger.info
+        self._log_warning = self.logger.warning
+        self._log_error = self.logger.error
+        self._log_critical = self.logger.critical
+        self._log = self.logger.log
         
-        # Create formatters
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Reuse handlers already attached for this logger and file
+        existing = _log_routes.get(self.name)
+        if existing and self.logger.handlers and \
+                existing[-1].baseFilename == os.path.abspath(self.log_file):
+            self._handlers = existing
+            return
         
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-        )
+        # Clear existing handlers
+        self.logger.handlers.clear()
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
         
-        # File handler
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        # Real handlers run on the listener thread; the logger only enqueues
+        self._handlers = [console_handler, self._create_file_handler()]
+        _log_routes[self.name] = self._handlers
+        for handler in existing or ():
+            handler.close()
+        self.logger.addHandler(_DroppingQueueHandler(_log_queue))
+        _start_listener(_log_queue)
+    
+    def _create_file_handler(self) -> logging.Handler:
+        """Create the file handler for this logger's log file"""
+        file_handler = BufferedFileHandler(self.log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FORMATTER)
+        return file_handler
+    
+    def set_level(self, level: int):
+        """Change the logger level"""
+        self.logger.setLevel(level)
     
     def debug(self, message: str, **kwargs):
         """Log debug message"""
-        self.logger.debug(self._format_message(message, **kwargs))
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self._log_debug(self._format_message(message, **kwargs), stacklevel=2)
     
     def info(self, message: str, **kwargs):
         """Log info message"""
-        formatted_msg = self._format_message(message, **kwargs)
-        self.logger.info(formatted_msg)
-        if COLORAMA_AVAILABLE:
-            print(f"{Fore.GREEN}{formatted_msg}{Style.RESET_ALL}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._log_info(self._format_message(message, **kwargs), stacklevel=2)
     
     def warning(self, message: str, **kwargs):
         """Log warning message"""
-        formatted_msg = self._format_message(message, **kwargs)
-        self.logger.warning(formatted_msg)
-        if COLORAMA_AVAILABLE:
-            print(f"{Fore.YELLOW}{formatted_msg}{Style.RESET_ALL}")
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        self._log_warning(self._format_message(message, **kwargs), stacklevel=2)
     
     def error(self, message: str, **kwargs):
         """Log error message"""
-        formatted_msg = self._format_message(message, **kwargs)
-        self.logger.error(formatted_msg)
-        if COLORAMA_AVAILABLE:
-            print(f"{Fore.RED}{formatted_msg}{Style.RESET_ALL}")
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self._log_error(self._format_message(message, **kwargs), stacklevel=2)
     
     def critical(self, message: str, **kwargs):
         """Log critical message"""
-        formatted_msg = self._format_message(message, **kwargs)
-        self.logger.critical(formatted_msg)
-        if COLORAMA_AVAILABLE:
-            print(f"{Fore.RED}{Back.WHITE}{formatted_msg}{Style.RESET_ALL}")
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
+        self._log_critical(self._format_message(message, **kwargs), stacklevel=2)
     
     def _format_message(self, message: str, **kwargs) -> str:
         """Format message with additional context"""
-        if kwargs:
-            context = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-            return f"{message} | {context}"
-        return message
+        if not kwargs:
+            return message
+        if len(kwargs) == 1:
+            (key, value), = kwargs.items()
+            return f"{message} | {key}={value}"
+        return message + " | " + " | ".join([f"{k}={v}" for k, v in kwargs.items()])
     
-    def log_biometric_event(self, event_type: str, success: bool, details: Optional[Dict[str, Any]] = None):
+    def _emit_structured(self, level: int, message: str, extra: Dict[str, Any]):
+        """Log a message with structured fields set as record attributes"""
+        if self.logger.isEnabledFor(level):
+            self._log(level, message, extra=extra, stacklevel=3)
+    
+    def log_biometric_event(self, event_type: str, success: bool, details: Optional[Dict[str, Any]] = None,
+                            stacklevel: int = 1):
         """Log biometric authentication event"""
-        status = "SUCCESS" if success else "FAILED"
-        message = f"Biometric {event_type}: {status}"
-        
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        message = f"Biometric {event_type}: {'SUCCESS' if success else 'FAILED'}"
         if details:
-            self.info(message, **details)
-        else:
-            self.info(message)
+            message = self._format_message(message, **details)
+        self._log_info(message, stacklevel=stacklevel + 1)
     
-    def log_webauthn_event(self, event_type: str, user_id: str, success: bool, details: Optional[Dict[str, Any]] = None):
+    def log_webauthn_event(self, event_type: str, user_id: str, success: bool, details: Optional[Dict[str, Any]] = None,
+                           stacklevel: int = 1):
         """Log WebAuthn event"""
-        status = "SUCCESS" if success else "FAILED"
-        message = f"WebAuthn {event_type}: {status}"
-        
-        event_details = {"user_id": user_id}
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        message = f"WebAuthn {event_type}: {'SUCCESS' if success else 'FAILED'} | user_id={user_id}"
         if details:
-            event_details.update(details)
-        
-        self.info(message, **event_details)
+            message = self._format_message(message, **details)
+        self._log_info(message, stacklevel=stacklevel + 1)
     
-    def log_security_event(self, event_type: str, severity: str, details: Optional[Dict[str, Any]] = None):
+    def log_security_event(self, event_type: str, severity: str, details: Optional[Dict[str, Any]] = None,
+                           stacklevel: int = 1):
         """Log security event"""
-        message = f"Security Event: {event_type}"
+        level = _SEVERITY_LEVELS.get(severity.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(level):
+            return
         
-        event_details = {"severity": severity}
+        message = f"Security Event: {event_type} | severity={severity}"
         if details:
-            event_details.update(details)
-        
-        if severity.upper() == "HIGH":
-            self.critical(message, **event_details)
-        elif severity.upper() == "MEDIUM":
-            self.warning(message, **event_details)
-        else:
-            self.info(message, **event_details)
+            message = self._format_message(message, **details)
+        # severity also goes to the JSON audit entry; text formatters ignore it
+        self._log(level, message, extra={'severity': severity}, stacklevel=stacklevel + 1)
 
 class ThreadSafeLogger(IGEDLogger):
-    """Thread-safe logger for multi-threaded applications"""
+    """Thread-safe logger for multi-threaded applications
     
-    def __init__(self, name: str, log_file: Optional[Path] = None):
-        super().__init__(name, log_file)
-        self._lock = threading.Lock()
-    
-    def _log_with_lock(self, level: str, message: str, **kwargs):
-        """Log message with thread lock"""
-        with self._lock:
-            if level == "debug":
-                self.debug(message, **kwargs)
-            elif level == "info":
-                self.info(message, **kwargs)
-            elif level == "warning":
-                self.warning(message, **kwargs)
-            elif level == "error":
-                self.error(message, **kwargs)
-            elif level == "critical":
-                self.critical(message, **kwargs)
+    logging handlers already serialize emit() with their own locks, so this
+    is kept only for API compatibility with existing thread_safe=True callers.
+    """
     
-    def debug(self, message: str, **kwargs):
-        """Thread-safe debug logging"""
-        self._log_with_lock("debug", message, **kwargs)
-    
-    def info(self, message: str, **kwargs):
-        """Thread-safe info logging"""
-        self._log_with_lock("info", message, **kwargs)
-    
-    def warning(self, message: str, **kwargs):
-        """Thread-safe warning logging"""
-        self._log_with_lock("warning", message, **kwargs)
-    
-    def error(self, message: str, **kwargs):
-        """Thread-safe error logging"""
-        self._log_with_lock("error", message, **kwargs)
-    
-    def critical(self, message: str, **kwargs):
-        """Thread-safe critical logging"""
-        self._log_with_lock("critical", message, **kwargs)
+    __slots__ = ()
 
 class AuditLogger(IGEDLogger):
     """Audit logger for security and compliance events"""
     
+    __slots__ = ()
+    
     def __init__(self, audit_file: Optional[Path] = None):
         audit_file = audit_file or Path("logs/audit.log")
         super().__init__("IGED_AUDIT", audit_file)
         self._setup_audit_logger()
     
+    def _create_file_handler(self) -> logging.Handler:
+        """Create the JSON audit handler, written in batches by the audit listener"""
+        file_handler = AppendFileHandler(self.log_file)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_JSON_FORMATTER)
+        return file_handler
+    
     def _setup_audit_logger(self):
         """Setup audit-specific logging"""
-        # Create JSON formatter for audit logs
-        class JSONFormatter(logging.Formatter):
-            def format(self, record):
-                log_entry = {
-                    'timestamp': datetime.now().isoformat(),
-                    'level': record.levelname,
-                    'logger': record.name,
-                    'message': record.getMessage(),
-                    'module': record.module,
-                    'function': record.funcName,
-                    'line': record.lineno
-                }
-                
-                # Add extra fields if present
-                if hasattr(record, 'user_id'):
-                    log_entry['user_id'] = record.user_id
-                if hasattr(record, 'event_type'):
-                    log_entry['event_type'] = record.event_type
-                if hasattr(record, 'ip_address'):
-                    log_entry['ip_address'] = record.ip_address
-                
-                return json.dumps(log_entry)
-        
-        # Replace file handler with JSON formatter
-        for handler in self.logger.handlers:
-            if isinstance(handler, logging.FileHandler):
-                handler.setFormatter(JSONFormatter())
+        # Audit bursts go through a drop-oldest ring instead of the shared queue
+        self.logger.handlers.clear()
+        self.logger.addHandler(logging.handlers.QueueHandler(_audit_queue))
+        _start_listener(_audit_queue)
     
     def log_authentication_attempt(self, user_id: str, method: str, success: bool, ip_address: Optional[str] = None):
         """Log authentication attempt"""
@@ -228,9 +497,9 @@ class AuditLogger(IGEDLogger):
             extra['ip_address'] = ip_address
         
         if success:
-            self.info("Authentication successful", **extra)
+            self._emit_structured(logging.INFO, "Authentication successful", extra)
         else:
-            self.warning("Authentication failed", **extra)
+            self._emit_structured(logging.WARNING, "Authentication failed", extra)
     
     def log_credential_operation(self, user_id: str, operation: str, success: bool, details: Optional[Dict[str, Any]] = None):
         """Log credential operation"""
@@ -241,12 +510,12 @@ class AuditLogger(IGEDLogger):
             'success': success
         }
         if details:
-            extra.update(details)
+            extra['details'] = details
         
         if success:
-            self.info("Credential operation completed", **extra)
+            self._emit_structured(logging.INFO, "Credential operation completed", extra)
         else:
-            self.warning("Credential operation failed", **extra)
+            self._emit_structured(logging.WARNING, "Credential operation failed", extra)
     
     def log_security_violation(self, violation_type: str, user_id: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         """Log security violation"""
@@ -257,16 +526,27 @@ class AuditLogger(IGEDLogger):
         if user_id:
             extra['user_id'] = user_id
         if details:
-            extra.update(details)
+            extra['details'] = details
         
-        self.critical("Security violation detected", **extra)
+        self._emit_structured(logging.CRITICAL, "Security violation detected", extra)
+
+_LOGGER_CACHE: Dict[tuple, IGEDLogger] = {}
+_init_lock = threading.RLock()
 
 def setup_logger(name: str, log_file: Optional[Path] = None, thread_safe: bool = False) -> IGEDLogger:
     """Setup and return a logger instance"""
-    if thread_safe:
-        return ThreadSafeLogger(name, log_file)
-    else:
-        return IGEDLogger(name, log_file)
+    key = (name, log_file, thread_safe)
+    logger = _LOGGER_CACHE.get(key)
+    if logger is None:
+        with _init_lock:
+            logger = _LOGGER_CACHE.get(key)
+            if logger is None:
+                if thread_safe:
+                    logger = ThreadSafeLogger(name, log_file)
+                else:
+                    logger = IGEDLogger(name, log_file)
+                _LOGGER_CACHE[key] = logger
+    return logger
 
 def setup_audit_logger(audit_file: Optional[Path] = None) -> AuditLogger:
     """Setup and return an audit logger instance"""
@@ -285,37 +565,43 @@ def get_biometric_logger() -> IGEDLogger:
     """Get biometric authentication logger"""
     global _biometric_logger
     if _biometric_logger is None:
-        _biometric_logger = setup_logger("IGED_BIOMETRIC", Path("logs/biometric.log"))
+        with _init_lock:
+            if _biometric_logger is None:
+                _biometric_logger = setup_logger("IGED_BIOMETRIC", Path("logs/biometric.log"))
     return _biometric_logger
 
 def get_webauthn_logger() -> IGEDLogger:
     """Get WebAuthn logger"""
     global _webauthn_logger
     if _webauthn_logger is None:
-        _webauthn_logger = setup_logger("IGED_WEBAUTHN", Path("logs/webauthn.log"))
+        with _init_lock:
+            if _webauthn_logger is None:
+                _webauthn_logger = setup_logger("IGED_WEBAUTHN", Path("logs/webauthn.log"))
     return _webauthn_logger
 
 def get_audit_logger() -> AuditLogger:
     """Get audit logger"""
     global _audit_logger
     if _audit_logger is None:
-        _audit_logger = setup_audit_logger(Path("logs/audit.log"))
+        with _init_lock:
+            if _audit_logger is None:
+                _audit_logger = setup_audit_logger(Path("logs/audit.log"))
     return _audit_logger
 
 def log_biometric_event(event_type: str, success: bool, details: Optional[Dict[str, Any]] = None):
     """Log biometric event using global logger"""
     logger = get_biometric_logger()
-    logger.log_biometric_event(event_type, success, details)
+    logger.log_biometric_event(event_type, success, details, stacklevel=2)
 
 def log_webauthn_event(event_type: str, user_id: str, success: bool, details: Optional[Dict[str, Any]] = None):
     """Log WebAuthn event using global logger"""
     logger = get_webauthn_logger()
-    logger.log_webauthn_event(event_type, user_id, success, details)
+    logger.log_webauthn_event(event_type, user_id, success, details, stacklevel=2)
 
 def log_security_event(event_type: str, severity: str, details: Optional[Dict[str, Any]] = None):
     """Log security event using global logger"""
     logger = get_audit_logger()
-    logger.log_security_event(event_type, severity, details)
+    logger.log_security_event(event_type, severity, details, stacklevel=2)
 
 # Test functions
 def test_logger():
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+IGED - Shared File Locations
+Paths used by more than one biometric component
+"""
+
+from pathlib import Path
+
+# Root of the IGED_Biometric_Auth package, independent of the working directory
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Credential store written by webauthn_server.py and shown by the manager GUI
+WEBAUTHN_CREDENTIALS_FILE = PACKAGE_DIR / "config" / "webauthn_credentials.json"
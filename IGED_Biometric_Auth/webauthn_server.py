@@ -9,12 +9,18 @@ import json
 import base64
 import hashlib
 import secrets
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from pathlib import Path
+import threading
+import time
+import atexit
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from utils.paths import WEBAUTHN_CREDENTIALS_FILE
 
 try:
-    from flask import Flask, request, jsonify, session, make_response
+    from flask import Flask, Response, request, jsonify, session, make_response
+    from flask.json.provider import DefaultJSONProvider, JSONProvider
     from flask_cors import CORS
     from fido2.server import Fido2Server
     from fido2.webauthn import (
@@ -33,50 +39,180 @@ except ImportError as e:
     print("💡 Install with: pip install flask flask-cors fido2")
     FLASK_AVAILABLE = False
 
+# Optional production WSGI server
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# Optional shared session store for multi-process deployments
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Pending ceremonies expire after this many seconds
+SESSION_MAX_AGE_SECONDS = 10 * 60
+
+# Upper bound on pending ceremonies of each kind; the oldest are evicted first
+MAX_PENDING_SESSIONS = 10000
+
+# Largest number of sub-requests accepted by /batch
+MAX_BATCH_REQUESTS = 32
+
+# /health and /stats payloads are rebuilt at most once per this many seconds
+STATUS_CACHE_TTL = 1.0
+
+# Sessions and credentials live in this process, so scale with threads, not workers
+WSGI_THREADS = 32
+
+CREDENTIALS_FILE = WEBAUTHN_CREDENTIALS_FILE
+
+# Credential changes are coalesced and written at most once per this many seconds
+CREDENTIALS_SAVE_DELAY = 1.0
+
+# Sync the credential file to disk before swapping it in; set WEBAUTHN_FSYNC=0 to skip
+CREDENTIALS_FSYNC = os.environ.get('WEBAUTHN_FSYNC', '1') != '0'
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class WebAuthnServer:
     """WebAuthn server for IGED credential management"""
     
-    def __init__(self, rp_id: str = "iged.example.com", rp_name: str = "IGED Biometric Auth"):
+    def __init__(self, rp_id: str = "iged.example.com", rp_name: str = "IGED Biometric Auth",
+                 redis_url: Optional[str] = None):
         self.rp_id = rp_id
         self.rp_name = rp_name
         self.rp = PublicKeyCredentialRpEntity(id=rp_id, name=rp_name)
         self.server = Fido2Server(self.rp)
         
         # In-memory storage (replace with database in production)
+        # Request threads share these, so every mutation holds self._lock
+        self._lock = threading.RLock()
         self.registered_users: Dict[str, Dict] = {}
         self.registration_sessions: Dict[str, Dict] = {}
         self.authentication_sessions: Dict[str, Dict] = {}
         
+        # Session deadlines in insertion order, which is also expiry order
+        self._reg_expiry: "OrderedDict[str, float]" = OrderedDict()
+        self._auth_expiry: "OrderedDict[str, float]" = OrderedDict()
+        self._session_tables = {
+            'registration': (self.registration_sessions, self._reg_expiry),
+            'authentication': (self.authentication_sessions, self._auth_expiry),
+        }
+        
+        # Pending sessions go to Redis with native expiry when configured
+        self._redis = None
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self._redis = redis.Redis.from_url(redis_url)
+                logger.info("Using Redis for WebAuthn sessions")
+            else:
+                logger.warning("WEBAUTHN_REDIS_URL set but redis is not installed; using in-memory sessions")
+        
+        # Decoded credential IDs per user, kept beside the JSON-safe store
+        self._credential_ids: Dict[str, List[bytes]] = {}
+        self._cred_index: Dict[bytes, Dict[str, Any]] = {}
+        self._total_credentials = 0
+        
+        # Option fields that never change between ceremonies, built on first use
+        self._reg_template: Optional[Dict[str, Any]] = None
+        self._auth_template: Optional[Dict[str, Any]] = None
+        
         # Load existing credentials
         self.load_credentials()
+        
+        # Debounced background writer for credential changes
+        self._dirty = threading.Event()
+        self._write_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._writer_loop, name="WebAuthnCredentialWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush_credentials)
     
     def load_credentials(self):
         """Load credentials from storage"""
         try:
-            creds_file = Path("config/webauthn_credentials.json")
+            creds_file = CREDENTIALS_FILE
             if creds_file.exists():
-                with open(creds_file, 'r') as f:
-                    self.registered_users = json.load(f)
+                self.registered_users = _loads(creds_file.read_bytes())
+                for user_id in self.registered_users:
+                    self._index_user(user_id)
+                self._total_credentials = len(self._cred_index)
                 logger.info(f"Loaded {len(self.registered_users)} registered users")
         except Exception as e:
             logger.error(f"Failed to load credentials: {e}")
     
+    def _index_user(self, user_id: str):
+        """Cache the decoded credential IDs for a user"""
+        credentials = self.registered_users[user_id].get('credentials', [])
+        cred_ids = [websafe_decode(cred['id']) for cred in credentials]
+        self._credential_ids[user_id] = cred_ids
+        self._cred_index.update(zip(cred_ids, credentials))
+    
     def save_credentials(self):
+        """Schedule credentials to be saved to storage"""
+        self._dirty.set()
+    
+    def flush_credentials(self):
+        """Write pending credential changes to storage now"""
+        with self._write_lock:
+            if self._dirty.is_set():
+                self._dirty.clear()
+                self._write_credentials()
+    
+    def _write_credentials(self):
         """Save credentials to storage"""
         try:
-            creds_file = Path("config/webauthn_credentials.json")
+            creds_file = CREDENTIALS_FILE
             creds_file.parent.mkdir(exist_ok=True)
-            with open(creds_file, 'w') as f:
-                json.dump(self.registered_users, f, indent=2)
+            with self._lock:
+                if ORJSON_AVAILABLE:
+                    data = orjson.dumps(self.registered_users, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self.registered_users, indent=2).encode('utf-8')
+            # Write a sibling temp file and swap it in so a crash never truncates the store
+            tmp_file = creds_file.with_name(creds_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                if CREDENTIALS_FSYNC:
+                    f.flush()
+                    getattr(os, 'fdatasync', os.fsync)(f.fileno())
+            os.replace(tmp_file, creds_file)
             logger.info("Credentials saved successfully")
         except Exception as e:
             logger.error(f"Failed to save credentials: {e}")
     
+    def _writer_loop(self):
+        """Coalesce bursts of credential changes into one write"""
+        while True:
+            self._dirty.wait()
+            time.sleep(CREDENTIALS_SAVE_DELAY)
+            self.flush_credentials()
+    
     def register_begin(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Begin WebAuthn registration"""
         try:
@@ -103,30 +239,20 @@ class WebAuthnServer:
             
             # Store session state
             session_id = secrets.token_urlsafe(32)
-            self.registration_sessions[session_id] = {
+            self._store_session('registration', session_id, {
                 'state': state,
                 'user': user_data,
-                'created': datetime.now().isoformat()
-            }
-            
-            # Clean up old sessions
-            self._cleanup_sessions()
+                'created': time.monotonic()
+            })
             
             logger.info(f"Registration begun for user: {user_name}")
             
-            return {
-                'session_id': session_id,
-                'options': {
-                    'challenge': websafe_encode(options.challenge),
+            if self._reg_template is None:
+                self._reg_template = {
                     'rp': {
                         'id': options.rp.id,
                         'name': options.rp.name
                     },
-                    'user': {
-                        'id': websafe_encode(options.user.id),
-                        'name': options.user.name,
-                        'displayName': options.user.display_name
-                    },
                     'pubKeyCredParams': [
                         {
                             'type': param.type,
@@ -134,13 +260,6 @@ class WebAuthnServer:
                         } for param in options.pub_key_cred_params
                     ],
                     'timeout': options.timeout,
-                    'excludeCredentials': [
-                        {
-                            'type': cred.type,
-                            'id': websafe_encode(cred.id),
-                            'transports': cred.transports
-                        } for cred in options.exclude_credentials
-                    ],
                     'authenticatorSelection': {
                         'authenticatorAttachment': options.authenticator_selection.authenticator_attachment,
                         'residentKey': options.authenticator_selection.resident_key,
@@ -148,6 +267,25 @@ class WebAuthnServer:
                     },
                     'attestation': options.attestation
                 }
+            
+            reg_options = self._reg_template.copy()
+            reg_options['challenge'] = websafe_encode(options.challenge)
+            reg_options['user'] = {
+                'id': websafe_encode(options.user.id),
+                'name': options.user.name,
+                'displayName': options.user.display_name
+            }
+            reg_options['excludeCredentials'] = [
+                {
+                    'type': cred.type,
+                    'id': websafe_encode(cred.id),
+                    'transports': cred.transports
+                } for cred in options.exclude_credentials
+            ]
+            
+            return {
+                'session_id': session_id,
+                'options': reg_options
             }
             
         except Exception as e:
@@ -157,10 +295,11 @@ class WebAuthnServer:
     def register_complete(self, session_id: str, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """Complete WebAuthn registration"""
         try:
-            if session_id not in self.registration_sessions:
+            # Consume the session up front so a replayed response cannot reuse it
+            session_data = self._take_session('registration', session_id)
+            if session_data is None:
                 return {'error': 'Invalid session ID'}
             
-            session_data = self.registration_sessions[session_id]
             state = session_data['state']
             user_data = session_data['user']
             
@@ -177,25 +316,26 @@ class WebAuthnServer:
             
             # Store credential
             user_id = user_data['id']
-            if user_id not in self.registered_users:
-                self.registered_users[user_id] = {
-                    'user': user_data,
-                    'credentials': []
-                }
-            
+            cred_id = auth_data.credential_data.credential_id
             credential_data = {
-                'id': websafe_encode(auth_data.credential_data.credential_id),
+                'id': websafe_encode(cred_id),
                 'public_key': websafe_encode(auth_data.credential_data.public_key),
                 'sign_count': auth_data.sign_count,
                 'registered': datetime.now().isoformat()
             }
             
-            self.registered_users[user_id]['credentials'].append(credential_data)
+            with self._lock:
+                if user_id not in self.registered_users:
+                    self.registered_users[user_id] = {
+                        'user': user_data,
+                        'credentials': []
+                    }
+                self.registered_users[user_id]['credentials'].append(credential_data)
+                self._credential_ids.setdefault(user_id, []).append(cred_id)
+                self._cred_index[cred_id] = credential_data
+                self._total_credentials += 1
             self.save_credentials()
             
-            # Clean up session
-            del self.registration_sessions[session_id]
-            
             logger.info(f"Registration completed for user: {user_data.get('name', 'Unknown')}")
             
             return {'status': 'success', 'message': 'Registration completed successfully'}
@@ -207,49 +347,54 @@ class WebAuthnServer:
     def authenticate_begin(self, user_id: str) -> Dict[str, Any]:
         """Begin WebAuthn authentication"""
         try:
-            if user_id not in self.registered_users:
-                return {'error': 'User not found'}
-            
-            user_data = self.registered_users[user_id]
-            credentials = user_data.get('credentials', [])
+            with self._lock:
+                if user_id not in self.registered_users:
+                    return {'error': 'User not found'}
+                
+                # Snapshot so a concurrent registration cannot skew the zip below
+                credentials = list(self.registered_users[user_id].get('credentials', []))
+                cred_ids = list(self._credential_ids.get(user_id, ()))
             
             if not credentials:
                 return {'error': 'No credentials found for user'}
             
             # Get authentication options
             options, state = self.server.authenticate_begin(
-                [websafe_decode(cred['id']) for cred in credentials],
+                cred_ids,
                 user_verification=UserVerificationRequirement.PREFERRED
             )
             
             # Store session state
             session_id = secrets.token_urlsafe(32)
-            self.authentication_sessions[session_id] = {
+            self._store_session('authentication', session_id, {
                 'state': state,
                 'user_id': user_id,
-                'created': datetime.now().isoformat()
-            }
-            
-            # Clean up old sessions
-            self._cleanup_sessions()
+                'created': time.monotonic()
+            })
             
             logger.info(f"Authentication begun for user: {user_id}")
             
-            return {
-                'session_id': session_id,
-                'options': {
-                    'challenge': websafe_encode(options.challenge),
+            if self._auth_template is None:
+                self._auth_template = {
                     'timeout': options.timeout,
                     'rpId': options.rp_id,
-                    'allowCredentials': [
-                        {
-                            'type': cred.type,
-                            'id': websafe_encode(cred.id),
-                            'transports': cred.transports
-                        } for cred in options.allow_credentials
-                    ],
                     'userVerification': options.user_verification
                 }
+            
+            auth_options = self._auth_template.copy()
+            auth_options['challenge'] = websafe_encode(options.challenge)
+            # allow_credentials mirrors the stored list, whose IDs are already encoded
+            auth_options['allowCredentials'] = [
+                {
+                    'type': cred.type,
+                    'id': stored['id'],
+                    'transports': cred.transports
+                } for cred, stored in zip(options.allow_credentials, credentials)
+            ]
+            
+            return {
+                'session_id': session_id,
+                'options': auth_options
             }
             
         except Exception as e:
@@ -259,10 +404,11 @@ class WebAuthnServer:
     def authenticate_complete(self, session_id: str, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """Complete WebAuthn authentication"""
         try:
-            if session_id not in self.authentication_sessions:
+            # Consume the session up front so a replayed response cannot reuse it
+            session_data = self._take_session('authentication', session_id)
+            if session_data is None:
                 return {'error': 'Invalid session ID'}
             
-            session_data = self.authentication_sessions[session_id]
             state = session_data['state']
             user_id = session_data['user_id']
             
@@ -280,17 +426,13 @@ class WebAuthnServer:
             )
             
             # Update sign count
-            user_data = self.registered_users[user_id]
-            for cred in user_data['credentials']:
-                if websafe_encode(auth_data.credential_id) == cred['id']:
+            with self._lock:
+                cred = self._cred_index.get(auth_data.credential_id)
+                if cred is not None:
                     cred['sign_count'] = auth_data.sign_count
-                    break
             
             self.save_credentials()
             
-            # Clean up session
-            del self.authentication_sessions[session_id]
-            
             logger.info(f"Authentication completed for user: {user_id}")
             
             return {
@@ -303,72 +445,150 @@ class WebAuthnServer:
             logger.error(f"Authentication complete failed: {e}")
             return {'error': str(e)}
     
-    def _cleanup_sessions(self, max_age_minutes: int = 10):
-        """Clean up expired sessions"""
-        cutoff = datetime.now() - timedelta(minutes=max_age_minutes)
+    def _store_session(self, kind: str, session_id: str, data: Dict[str, Any]):
+        """Store a pending session, evicting expired and overflow sessions"""
+        if self._redis is not None:
+            self._redis.setex(f"iged:webauthn:{kind}:{session_id}", SESSION_MAX_AGE_SECONDS, _dumps(data))
+            return
         
-        # Clean registration sessions
-        expired_reg = [
-            sid for sid, data in self.registration_sessions.items()
-            if datetime.fromisoformat(data['created']) < cutoff
-        ]
-        for sid in expired_reg:
-            del self.registration_sessions[sid]
+        sessions, expiry = self._session_tables[kind]
+        with self._lock:
+            sessions[session_id] = data
+            expiry[session_id] = data['created'] + SESSION_MAX_AGE_SECONDS
+            while len(expiry) > MAX_PENDING_SESSIONS:
+                oldest, _ = expiry.popitem(last=False)
+                sessions.pop(oldest, None)
+            
+            # Clean up old sessions
+            self._cleanup_sessions()
+    
+    def _take_session(self, kind: str, session_id: str) -> Optional[Dict[str, Any]]:
+        """Remove and return a pending session, so each one is used at most once"""
+        if self._redis is not None:
+            key = f"iged:webauthn:{kind}:{session_id}"
+            # GET and DEL in one MULTI so concurrent callers cannot both read it
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.get(key)
+            pipe.delete(key)
+            raw, _ = pipe.execute()
+            return _loads(raw) if raw is not None else None
         
-        # Clean authentication sessions
-        expired_auth = [
-            sid for sid, data in self.authentication_sessions.items()
-            if datetime.fromisoformat(data['created']) < cutoff
-        ]
-        for sid in expired_auth:
-            del self.authentication_sessions[sid]
+        sessions, expiry = self._session_tables[kind]
+        with self._lock:
+            expiry.pop(session_id, None)
+            return sessions.pop(session_id, None)
+    
+    def _cleanup_sessions(self):
+        """Clean up expired sessions"""
+        now = time.monotonic()
+        expired_reg = self._expire_sessions(self.registration_sessions, self._reg_expiry, now)
+        expired_auth = self._expire_sessions(self.authentication_sessions, self._auth_expiry, now)
         
         if expired_reg or expired_auth:
-            logger.info(f"Cleaned up {len(expired_reg)} registration and {len(expired_auth)} authentication sessions")
+            logger.info(f"Cleaned up {expired_reg} registration and {expired_auth} authentication sessions")
+    
+    @staticmethod
+    def _expire_sessions(sessions: Dict[str, Dict], expiry: "OrderedDict[str, float]", now: float) -> int:
+        """Pop sessions from the front of the expiry order until one is still live"""
+        count = 0
+        while expiry:
+            session_id, deadline = next(iter(expiry.items()))
+            if deadline >= now:
+                break
+            expiry.popitem(last=False)
+            sessions.pop(session_id, None)
+            count += 1
+        return count
     
     def get_users(self) -> List[Dict[str, Any]]:
         """Get list of registered users"""
-        return [
-            {
-                'id': user_id,
-                'user': user_data['user'],
-                'credential_count': len(user_data.get('credentials', []))
-            }
-            for user_id, user_data in self.registered_users.items()
-        ]
+        with self._lock:
+            return [
+                {
+                    'id': user_id,
+                    'user': user_data['user'],
+                    'credential_count': len(user_data.get('credentials', []))
+                }
+                for user_id, user_data in self.registered_users.items()
+            ]
     
     def delete_user(self, user_id: str) -> Dict[str, Any]:
         """Delete a user and all their credentials"""
         try:
-            if user_id in self.registered_users:
+            with self._lock:
+                if user_id not in self.registered_users:
+                    return {'error': 'User not found'}
                 del self.registered_users[user_id]
-                self.save_credentials()
-                logger.info(f"Deleted user: {user_id}")
-                return {'status': 'success', 'message': 'User deleted successfully'}
-            else:
-                return {'error': 'User not found'}
+                cred_ids = self._credential_ids.pop(user_id, ())
+                for cred_id in cred_ids:
+                    self._cred_index.pop(cred_id, None)
+                self._total_credentials -= len(cred_ids)
+            self.save_credentials()
+            logger.info(f"Deleted user: {user_id}")
+            return {'status': 'success', 'message': 'User deleted successfully'}
         except Exception as e:
             logger.error(f"Failed to delete user {user_id}: {e}")
             return {'error': str(e)}
 
 # Create Flask app
 if FLASK_AVAILABLE:
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson"""
+        
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=DefaultJSONProvider.default).decode('utf-8')
+        
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+    
+    def _json_response(payload: Any, status: int = 200) -> Response:
+        """Serialize a small payload straight into a JSON response"""
+        return Response(_dumps(payload), status=status, mimetype='application/json')
+    
     app = Flask(__name__)
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
     app.secret_key = secrets.token_hex(32)
     CORS(app)
     
     # Create WebAuthn server instance
-    webauthn_server = WebAuthnServer()
+    webauthn_server = WebAuthnServer(redis_url=os.environ.get('WEBAUTHN_REDIS_URL'))
+    
+    # Static part of the health payload; only the timestamp is restamped
+    _HEALTH_INFO = {
+        'status': 'healthy',
+        'service': 'IGED WebAuthn Server',
+        'version': '1.0.0',
+    }
+    _status_cache: Dict[str, Tuple[float, bytes]] = {}
+    
+    def _cached_json(key: str, build: Callable[[], Dict[str, Any]]) -> Response:
+        """Serve a recently serialized payload, rebuilding it once it is STATUS_CACHE_TTL old"""
+        now = time.monotonic()
+        entry = _status_cache.get(key)
+        if entry is None or entry[0] <= now:
+            entry = (now + STATUS_CACHE_TTL, _dumps(build()))
+            _status_cache[key] = entry
+        return Response(entry[1], mimetype='application/json')
+    
+    def _build_health() -> Dict[str, Any]:
+        """Stamp the static health payload with the current time"""
+        return dict(_HEALTH_INFO, timestamp=datetime.now().isoformat())
+    
+    def _build_stats() -> Dict[str, Any]:
+        """Collect server statistics"""
+        return {
+            'total_users': len(webauthn_server.registered_users),
+            'total_credentials': webauthn_server._total_credentials,
+            'active_registration_sessions': len(webauthn_server.registration_sessions),
+            'active_authentication_sessions': len(webauthn_server.authentication_sessions),
+            'server_started': datetime.now().isoformat()
+        }
     
     @app.route('/health', methods=['GET'])
     def health_check():
         """Health check endpoint"""
-        return jsonify({
-            'status': 'healthy',
-            'service': 'IGED WebAuthn Server',
-            'version': '1.0.0',
-            'timestamp': datetime.now().isoformat()
-        })
+        return _cached_json('health', _build_health)
     
     @app.route('/register', methods=['POST'])
     def register():
@@ -376,16 +596,16 @@ if FLASK_AVAILABLE:
         try:
             data = request.get_json()
             if not data or 'user' not in data:
-                return jsonify({'error': 'Missing user data'}), 400
+                return _json_response({'error': 'Missing user data'}, 400)
             
             result = webauthn_server.register_begin(data['user'])
             if 'error' in result:
-                return jsonify(result), 400
+                return _json_response(result, 400)
             
-            return jsonify(result)
+            return _json_response(result)
         except Exception as e:
             logger.error(f"Registration error: {e}")
-            return jsonify({'error': 'Internal server error'}), 500
+            return _json_response({'error': 'Internal server error'}, 500)
     
     @app.route('/register/complete', methods=['POST'])
     def register_complete():
@@ -393,16 +613,16 @@ if FLASK_AVAILABLE:
         try:
             data = request.get_json()
             if not data or 'session_id' not in data or 'response' not in data:
-                return jsonify({'error': 'Missing session ID or response'}), 400
+                return _json_response({'error': 'Missing session ID or response'}, 400)
             
             result = webauthn_server.register_complete(data['session_id'], data['response'])
             if 'error' in result:
-                return jsonify(result), 400
+                return _json_response(result, 400)
             
-            return jsonify(result)
+            return _json_response(result)
         except Exception as e:
             logger.error(f"Registration complete error: {e}")
-            return jsonify({'error': 'Internal server error'}), 500
+            return _json_response({'error': 'Internal server error'}, 500)
     
     @app.route('/authenticate', methods=['POST'])
     def authenticate():
@@ -410,16 +630,16 @@ if FLASK_AVAILABLE:
         try:
             data = request.get_json()
             if not data or 'user_id' not in data:
-                return jsonify({'error': 'Missing user ID'}), 400
+                return _json_response({'error': 'Missing user ID'}, 400)
             
             result = webauthn_server.authenticate_begin(data['user_id'])
             if 'error' in result:
-                return jsonify(result), 400
+                return _json_response(result, 400)
             
-            return jsonify(result)
+            return _json_response(result)
         except Exception as e:
             logger.error(f"Authentication error: {e}")
-            return jsonify({'error': 'Internal server error'}), 500
+            return _json_response({'error': 'Internal server error'}, 500)
     
     @app.route('/authenticate/complete', methods=['POST'])
     def authenticate_complete():
@@ -427,16 +647,71 @@ if FLASK_AVAILABLE:
         try:
             data = request.get_json()
             if not data or 'session_id' not in data or 'response' not in data:
-                return jsonify({'error': 'Missing session ID or response'}), 400
+                return _json_response({'error': 'Missing session ID or response'}, 400)
             
             result = webauthn_server.authenticate_complete(data['session_id'], data['response'])
             if 'error' in result:
-                return jsonify(result), 400
+                return _json_response(result, 400)
             
-            return jsonify(result)
+            return _json_response(result)
         except Exception as e:
             logger.error(f"Authentication complete error: {e}")
-            return jsonify({'error': 'Internal server error'}), 500
+            return _json_response({'error': 'Internal server error'}, 500)
+    
+    # Routes that /batch can dispatch to: (required body keys, handler)
+    _BATCH_HANDLERS = {
+        ('/register', 'POST'): (
+            ('user',), lambda body: webauthn_server.register_begin(body['user'])),
+        ('/register/complete', 'POST'): (
+            ('session_id', 'response'),
+            lambda body: webauthn_server.register_complete(body['session_id'], body['response'])),
+        ('/authenticate', 'POST'): (
+            ('user_id',), lambda body: webauthn_server.authenticate_begin(body['user_id'])),
+        ('/authenticate/complete', 'POST'): (
+            ('session_id', 'response'),
+            lambda body: webauthn_server.authenticate_complete(body['session_id'], body['response'])),
+    }
+    
+    def _run_batch_request(sub_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one /batch sub-request to its handler"""
+        sub_id = sub_request.get('id')
+        url = sub_request.get('url')
+        route = (url, str(sub_request.get('method', 'POST')).upper())
+        entry = _BATCH_HANDLERS.get(route) if isinstance(url, str) else None
+        if entry is None:
+            return {'id': sub_id, 'status': 404, 'body': {'error': 'Unsupported batch route'}}
+        
+        required, handler = entry
+        body = sub_request.get('body')
+        if not isinstance(body, dict) or any(key not in body for key in required):
+            return {'id': sub_id, 'status': 400, 'body': {'error': f"Missing {', '.join(required)}"}}
+        
+        try:
+            result = handler(body)
+        except Exception as e:
+            logger.error(f"Batch request error: {e}")
+            return {'id': sub_id, 'status': 500, 'body': {'error': 'Internal server error'}}
+        return {'id': sub_id, 'status': 400 if 'error' in result else 200, 'body': result}
+    
+    @app.route('/batch', methods=['POST'])
+    def batch():
+        """Run several WebAuthn requests in one round trip"""
+        try:
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict) or not isinstance(data.get('requests'), list):
+                return _json_response({'error': 'Missing requests'}, 400)
+            sub_requests = data['requests']
+            if len(sub_requests) > MAX_BATCH_REQUESTS:
+                return _json_response({'error': f'At most {MAX_BATCH_REQUESTS} requests per batch'}, 400)
+            if not all(isinstance(sub_request, dict) for sub_request in sub_requests):
+                return _json_response({'error': 'Each request must be an object'}, 400)
+            
+            # Credential changes from every sub-request share one debounced save
+            responses = [_run_batch_request(sub_request) for sub_request in sub_requests]
+            return _json_response({'responses': responses})
+        except Exception as e:
+            logger.error(f"Batch error: {e}")
+            return _json_response({'error': 'Internal server error'}, 500)
     
     @app.route('/users', methods=['GET'])
     def get_users():
@@ -465,17 +740,7 @@ if FLASK_AVAILABLE:
     def get_stats():
         """Get server statistics"""
         try:
-            stats = {
-                'total_users': len(webauthn_server.registered_users),
-                'total_credentials': sum(
-                    len(user_data.get('credentials', []))
-                    for user_data in webauthn_server.registered_users.values()
-                ),
-                'active_registration_sessions': len(webauthn_server.registration_sessions),
-                'active_authentication_sessions': len(webauthn_server.authentication_sessions),
-                'server_started': datetime.now().isoformat()
-            }
-            return jsonify(stats)
+            return _cached_json('stats', _build_stats)
         except Exception as e:
             logger.error(f"Stats error: {e}")
             return jsonify({'error': 'Internal server error'}), 500
@@ -494,12 +759,17 @@ def main():
     print("=" * 40)
     
     # Run the server
-    app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=True,
-        threaded=True
-    )
+    if WAITRESS_AVAILABLE:
+        print(f"🌐 Serving with waitress ({WSGI_THREADS} threads)")
+        waitress_serve(app, host='0.0.0.0', port=5000, threads=WSGI_THREADS)
+    else:
+        print("💡 Install waitress for a production server: pip install waitress")
+        app.run(
+            host='0.0.0.0',
+            port=5000,
+            debug=False,
+            threaded=True
+        )
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
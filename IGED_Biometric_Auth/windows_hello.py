@@ -4,9 +4,12 @@ IGED - Windows Hello Biometric Authentication Module
 Native Windows biometric authentication using WinRT APIs
 """
 
+from __future__ import annotations
+
 import asyncio
 import sys
 import os
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 import logging
@@ -27,6 +30,9 @@ except ImportError:
     logger.warning("pywinrt not available. Windows Hello features disabled.")
     WINDOWS_HELLO_AVAILABLE = False
 
+# How long a hardware availability answer is trusted before asking WinRT again
+AVAILABILITY_TTL_SECONDS = 30.0
+
 class WindowsHelloManager:
     """Manages Windows Hello biometric authentication"""
     
@@ -34,6 +40,8 @@ class WindowsHelloManager:
         self.availability = None
         self.verification_result = None
         self._initialized = False
+        self._init_lock = None
+        self._avail_expiry = 0.0
     
     async def initialize(self) -> bool:
         """Initialize Windows Hello manager"""
@@ -43,6 +51,7 @@ class WindowsHelloManager:
         
         try:
             self.availability = await UserConsentVerifier.check_availability_async()
+            self._avail_expiry = time.monotonic() + AVAILABILITY_TTL_SECONDS
             self._initialized = True
             logger.info(f"Windows Hello initialized. Availability: {self.availability}")
             return True
@@ -50,20 +59,34 @@ class WindowsHelloManager:
             logger.error(f"Failed to initialize Windows Hello: {e}")
             return False
     
+    async def _ensure_init(self):
+        """Initialize once, even when several coroutines ask at the same time"""
+        if self._initialized:
+            return
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if not self._initialized:
+                await self.initialize()
+    
     async def check_availability(self) -> UserConsentVerificationAvailability:
         """Check if Windows Hello is available"""
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_init()
         
-        if self.availability is None:
-            self.availability = await UserConsentVerifier.check_availability_async()
+        if self._availability_fresh():
+            return self.availability
         
+        self.availability = await UserConsentVerifier.check_availability_async()
+        self._avail_expiry = time.monotonic() + AVAILABILITY_TTL_SECONDS
         return self.availability
     
+    def _availability_fresh(self) -> bool:
+        """Whether the cached availability is still within its TTL"""
+        return self.availability is not None and time.monotonic() < self._avail_expiry
+    
     async def request_verification(self, reason: str = "Authenticate to unlock IGED") -> UserConsentVerificationResult:
         """Request biometric verification from user"""
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_init()
         
         try:
             logger.info(f"Requesting Windows Hello verification: {reason}")
@@ -75,11 +98,21 @@ class WindowsHelloManager:
             logger.error(f"Windows Hello verification failed: {e}")
             return UserConsentVerificationResult.CANCELED
     
+    async def _authenticate_flow(self, reason: str):
+        """Check availability then request verification; None when unavailable"""
+        availability = await self.check_availability()
+        if availability == UserConsentVerificationAvailability.UNAVAILABLE:
+            return None
+        return await self.request_verification(reason)
+    
     def is_available(self) -> bool:
         """Check if Windows Hello is available (synchronous)"""
         if not WINDOWS_HELLO_AVAILABLE:
             return False
         
+        if self._availability_fresh():
+            return self.availability != UserConsentVerificationAvailability.UNAVAILABLE
+        
         try:
             loop = asyncio.get_event_loop()
             if loop.is_running():
@@ -99,14 +132,12 @@ class WindowsHelloManager:
             return False
         
         try:
-            # Check availability first
-            if not self.is_available():
+            # Check availability and request verification on one event loop
+            result = asyncio.run(self._authenticate_flow(reason))
+            if result is None:
                 logger.warning("Windows Hello not available on this system")
                 return False
             
-            # Request verification
-            result = asyncio.run(self.request_verification(reason))
-            
             # Check result
             if result == UserConsentVerificationResult.VERIFIED:
                 logger.info("Windows Hello authentication successful")
@@ -166,10 +197,6 @@ async def biometric_authenticate_async(reason: str = "Authenticate to unlock IGE
     """
     manager = get_windows_hello_manager()
     
-    # Initialize if needed
-    if not manager._initialized:
-        await manager.initialize()
-    
     # Check availability
     availability = await manager.check_availability()
     if availability == UserConsentVerificationAvailability.UNAVAILABLE:
@@ -200,7 +227,6 @@ async def check_biometric_availability_async():
         return False
     
     manager = get_windows_hello_manager()
-    await manager.initialize()
     availability = await manager.check_availability()
     return availability != UserConsentVerificationAvailability.UNAVAILABLE
 
@@ -210,7 +236,6 @@ async def request_biometric_verification(reason: str = "Authenticate to unlock I
         return UserConsentVerificationResult.CANCELED
     
     manager = get_windows_hello_manager()
-    await manager.initialize()
     return await manager.request_verification(reason)
 
 def biometric_authenticate_sync_legacy():
@@ -7,13 +7,16 @@ Comprehensive script to add all project files and folders
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 
-def run_command(command, description):
+def run_command(argv: List[str], description: str, input_text: Optional[str] = None):
     """Run a git command and return success status"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        # Argument list, no shell: git is exec'd directly without a /bin/sh in between
+        result = subprocess.run(argv, input=input_text, capture_output=True, text=True)
         if result.returncode == 0:
             print(f"✅ {description} completed successfully")
             return True, result.stdout
@@ -24,14 +27,35 @@ def run_command(command, description):
         print(f"❌ {description} error: {e}")
         return False, str(e)
 
-def get_file_count():
+# Directories that are never part of the upload and are pruned without descending
+SKIP_DIRS = {'.git', '.venv', '__pycache__', 'node_modules', '.mypy_cache'}
+
+# Message for the upload commit; main() fills in {file_count}
+COMMIT_TEMPLATE = """Add complete IGED project with all files and folders
+
+- Core system components (voice pipeline, encryption, memory engine)
+- Agent modules (codegen, secops, data miner, network intelligence) 
+- Plugin system with exploit developer and system info
+- Windows GUI and web admin panel
+- Android client integration
+- Build scripts and installation tools
+- Documentation and configuration files
+- Biometric authentication integration suite
+- Complete project structure with all dependencies
+
+Total files: {file_count}"""
+
+def get_file_count(path='.'):
     """Count total files in the project"""
     count = 0
-    for root, dirs, files in os.walk('.'):
-        # Skip .git directory
-        if '.git' in root:
-            continue
-        count += len(files)
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # DirEntry caches the file type from readdir, so this needs no stat()
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    count += get_file_count(entry.path)
+            else:
+                count += 1
     return count
 
 def main():
@@ -44,39 +68,46 @@ def main():
         print("❌ Error: launcher.py not found. Please run this script from the IGED project root directory.")
         sys.exit(1)
     
-    # Count files
+    # Count files on a worker thread while git is prepared; the walk is mostly stat syscalls
     print("📊 Counting files...")
-    file_count = get_file_count()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        count_future = executor.submit(get_file_count)
+        
+        # Initialize git if needed; a fresh repository has no remotes to check
+        has_origin = False
+        if not os.path.exists('.git'):
+            success, _ = run_command(['git', 'init'], 'Initializing git repository')
+            if not success:
+                sys.exit(1)
+            print()
+        else:
+            success, output = run_command(['git', 'remote'], 'Checking remote repository')
+            has_origin = success and 'origin' in output.split()
+        
+        # Add remote if needed
+        if not has_origin:
+            success, _ = run_command(
+                ['git', 'remote', 'add', 'origin', 'https://github.com/amirakm12/Project-Human-Bot-IGED.git'],
+                'Adding remote repository'
+            )
+            if not success:
+                sys.exit(1)
+            print()
+        
+        file_count = count_future.result()
+    
     print(f"📁 Found {file_count} files to add")
     print()
     
-    # Initialize git if needed
-    if not os.path.exists('.git'):
-        success, _ = run_command('git init', 'Initializing git repository')
-        if not success:
-            sys.exit(1)
-        print()
-    
-    # Add remote if needed
-    success, output = run_command('git remote -v', 'Checking remote repository')
-    if not success or 'origin' not in output:
-        success, _ = run_command(
-            'git remote add origin https://github.com/amirakm12/Project-Human-Bot-IGED.git',
-            'Adding remote repository'
-        )
-        if not success:
-            sys.exit(1)
-        print()
-    
     # Add all files
     print("📦 Adding all files and folders...")
-    success, output = run_command('git add .', 'Adding all files to git')
+    success, output = run_command(['git', 'add', '.'], 'Adding all files to git')
     if not success:
         sys.exit(1)
     print()
     
     # Check if there are changes to commit
-    success, output = run_command('git status --porcelain', 'Checking for changes')
+    success, output = run_command(['git', 'status', '--porcelain'], 'Checking for changes')
     if not success:
         sys.exit(1)
     
@@ -85,35 +116,19 @@ def main():
         return
     
     # Commit changes
-    commit_message = """Add complete IGED project with all files and folders
-
-- Core system components (voice pipeline, encryption, memory engine)
-- Agent modules (codegen, secops, data miner, network intelligence) 
-- Plugin system with exploit developer and system info
-- Windows GUI and web admin panel
-- Android client integration
-- Build scripts and installation tools
-- Documentation and configuration files
-- Biometric authentication integration suite
-- Complete project structure with all dependencies
-
-Total files: {file_count}"""
+    commit_message = COMMIT_TEMPLATE.format(file_count=file_count)
     
-    success, _ = run_command(f'git commit -m "{commit_message}"', 'Committing all changes')
+    success, _ = run_command(['git', 'commit', '-F', '-'], 'Committing all changes', input_text=commit_message)
     if not success:
         sys.exit(1)
     print()
     
-    # Push to GitHub
+    # Push to GitHub; HEAD pushes whichever branch is checked out in one round trip
     print("🚀 Pushing to GitHub...")
-    success, _ = run_command('git push -u origin main', 'Pushing to main branch')
-    
+    success, _ = run_command(['git', 'push', '-u', 'origin', 'HEAD'], 'Pushing current branch')
     if not success:
-        print("🔄 Trying master branch...")
-        success, _ = run_command('git push -u origin master', 'Pushing to master branch')
-        if not success:
-            print("❌ Failed to push to GitHub. Please check your credentials and try again.")
-            sys.exit(1)
+        print("❌ Failed to push to GitHub. Please check your credentials and try again.")
+        sys.exit(1)
     
     print()
     print("🎉 SUCCESS! All files have been added to GitHub!")
@@ -6,6 +6,7 @@ Remote control and monitoring interface
 import threading
 import time
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import logging
 
@@ -14,8 +15,9 @@ logger = logging.getLogger(__name__)
 
 # Try to import Flask dependencies
 try:
-    from flask import Flask, render_template, request, jsonify, redirect, url_for
+    from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, stream_with_context
     from flask_cors import CORS
+    from werkzeug.serving import make_server
     FLASK_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"⚠️ Flask not available: {e}")
@@ -34,12 +36,95 @@ except ImportError as e:
         return ""
     def url_for(*args, **kwargs):
         return ""
+    class Response:
+        def __init__(self, *args, **kwargs):
+            pass
+    def stream_with_context(generator):
+        return generator
     class CORS:
         def __init__(self, *args, **kwargs):
             pass
 
+# Try to import waitress, a production WSGI server that also runs on Windows
+try:
+    from waitress.server import create_server as waitress_create_server
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# Try to import orjson for faster response encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Dashboards poll /api/status; one component fan-out serves every poll in this window
+STATUS_CACHE_TTL = 0.5
+
+# Request threads for the panel; components live in this process, so it runs one worker
+WSGI_THREADS = 8
+
+# Fields of /api/status that never change; each refresh copies this and adds the rest
+_STATUS_SKELETON = {
+    'system': 'IGED',
+    'version': '1.0.0'
+}
+
+# Most memory entries a single /api/memory request may ask for
+MAX_MEMORY_LIMIT = 500
+
+# (component, status method) pairs queried for /api/status; the component is also the key
+_STATUS_SOURCES = (
+    ('voice', 'get_status'),
+    ('orchestrator', 'get_system_status'),
+    ('memory', 'get_statistics'),
+)
+
+# (second, ISO string) for the last second a status timestamp was formatted in
+_ts_cache = (0, "")
+
+def _status_timestamp() -> str:
+    """Local ISO timestamp at one-second resolution, formatted once per second"""
+    global _ts_cache
+    now = int(time.time())
+    second, text = _ts_cache
+    if now != second:
+        text = datetime.fromtimestamp(now).isoformat()
+        _ts_cache = (now, text)
+    return text
+
+def _parse_limit(args, default: int):
+    """Read ?limit= capped at MAX_MEMORY_LIMIT; None if it is not a positive integer"""
+    raw = args.get('limit')
+    if not raw:
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        return None
+    return min(limit, MAX_MEMORY_LIMIT) if limit > 0 else None
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+def _stream_entries(entries, **fields):
+    """Stream {**fields, "entries": [...]} one encoded entry at a time"""
+    def generate():
+        head = _dumps(fields)
+        yield head[:-1] + (b',"entries":[' if fields else b'"entries":[')
+        for i, entry in enumerate(entries):
+            if i:
+                yield b','
+            yield _dumps(entry)
+        yield b']}'
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 class WebAdminPanel:
     def __init__(self, components):
         self.components = components
@@ -49,6 +134,7 @@ class WebAdminPanel:
             logger.warning("⚠️ Flask not available, web admin panel disabled")
             self.app = None
             self.server_thread = None
+            self._server = None
             self.running = False
             return
         
@@ -56,8 +142,18 @@ class WebAdminPanel:
         self.app.config['SECRET_KEY'] = 'iged-secret-key-2024'
         CORS(self.app)
         
+        # (expiry, status) from the last fan-out; the lock lets one request refresh it
+        self._status_cache = (0.0, None)
+        self._status_lock = threading.Lock()
+        self._status_pool = ThreadPoolExecutor(max_workers=len(_STATUS_SOURCES), thread_name_prefix='webadmin-status')
+        
+        # Searches in progress, keyed by arguments, so duplicates wait on one backend call
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        
         self.setup_routes()
         self.server_thread = None
+        self._server = None
         self.running = False
     
     def setup_routes(self):
@@ -71,28 +167,7 @@ class WebAdminPanel:
         def get_status():
             """Get system status"""
             try:
-                status = {
-                    'timestamp': datetime.now().isoformat(),
-                    'system': 'IGED',
-                    'version': '1.0.0'
-                }
-                
-                # Voice pipeline status
-                if 'voice' in self.components:
-                    voice_status = self.components['voice'].get_status()
-                    status['voice'] = voice_status
-                
-                # Orchestrator status
-                if 'orchestrator' in self.components:
-                    orch_status = self.components['orchestrator'].get_system_status()
-                    status['orchestrator'] = orch_status
-                
-                # Memory status
-                if 'memory' in self.components:
-                    memory_stats = self.components['memory'].get_statistics()
-                    status['memory'] = memory_stats
-                
-                return jsonify(status)
+                return jsonify(self._cached_status())
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
@@ -120,11 +195,13 @@ class WebAdminPanel:
         def get_memory():
             """Get memory entries"""
             try:
-                limit = request.args.get('limit', 50, type=int)
+                limit = _parse_limit(request.args, 50)
+                if limit is None:
+                    return jsonify({'error': 'limit must be a positive integer'}), 400
                 
                 if 'memory' in self.components:
                     entries = self.components['memory'].get_recent_entries(limit)
-                    return jsonify({'entries': entries})
+                    return _stream_entries(entries)
                 else:
                     return jsonify({'error': 'Memory not available'}), 500
                     
@@ -135,15 +212,18 @@ class WebAdminPanel:
         def search_memory():
             """Search memory entries"""
             try:
-                query = request.args.get('q', '').strip()
-                limit = request.args.get('limit', 20, type=int)
+                args = request.args
+                query = (args.get('q') or '').strip()
+                limit = _parse_limit(args, 20)
                 
                 if not query:
                     return jsonify({'error': 'No search query provided'}), 400
+                if limit is None:
+                    return jsonify({'error': 'limit must be a positive integer'}), 400
                 
                 if 'memory' in self.components:
-                    entries = self.components['memory'].search_entries(query, limit)
-                    return jsonify({'entries': entries, 'query': query})
+                    entries = self._search_once(query, limit)
+                    return _stream_entries(entries, query=query)
                 else:
                     return jsonify({'error': 'Memory not available'}), 500
                     
@@ -218,26 +298,112 @@ class WebAdminPanel:
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
     
+    def _collect_status(self) -> dict:
+        """Query every component for its status"""
+        status = _STATUS_SKELETON.copy()
+        status['timestamp'] = _status_timestamp()
+        
+        # The components are independent, so query them side by side
+        futures = {
+            name: self._status_pool.submit(getattr(self.components[name], method))
+            for name, method in _STATUS_SOURCES
+            if name in self.components
+        }
+        for name, future in futures.items():
+            status[name] = future.result()
+        
+        return status
+    
+    def _cached_status(self) -> dict:
+        """Get system status, refreshing it at most once per STATUS_CACHE_TTL"""
+        expires, status = self._status_cache
+        if status is not None and time.monotonic() < expires:
+            return status
+        
+        with self._status_lock:
+            # Another request may have refreshed it while this one waited
+            expires, status = self._status_cache
+            if status is None or time.monotonic() >= expires:
+                status = self._collect_status()
+                self._status_cache = (time.monotonic() + STATUS_CACHE_TTL, status)
+            return status
+    
+    def _search_once(self, query: str, limit: int) -> list:
+        """Search memory, sharing one backend call among identical concurrent searches"""
+        key = ('search', query, limit)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if leader:
+            try:
+                future.set_result(self.components['memory'].search_entries(query, limit))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[key]
+        return future.result()
+    
     def start(self):
         """Start the web admin server"""
         if self.running:
             logger.warning("Web admin already running")
             return
         
+        if self.app is None:
+            logger.warning("⚠️ Flask not available, web admin panel not started")
+            return
+        
+        # Bind here so a busy port is reported to the caller instead of inside the thread
+        try:
+            self._server = self._create_server()
+        except OSError as e:
+            logger.error(f"Web admin server error: {e}")
+            return
+        
         self.running = True
-        self.server_thread = threading.Thread(target=self._run_server, daemon=True)
+        # Daemon only as a fallback for exits that skip stop(); stop() shuts it down cleanly
+        self.server_thread = threading.Thread(target=self._run_server, args=(self._server,),
+                                              name="WebAdminServer", daemon=True)
         self.server_thread.start()
         logger.info("🌐 Web admin panel started on http://localhost:8080")
     
     def stop(self):
         """Stop the web admin server"""
         self.running = False
+        server, self._server = self._server, None
+        if server is not None:
+            # Close the listening socket so port 8080 is free again right away
+            if WAITRESS_AVAILABLE:
+                # close() alone leaves the request worker threads running; stop them first
+                server.task_dispatcher.shutdown()
+                server.close()
+            else:
+                server.shutdown()
+            self.server_thread.join(timeout=5)
         logger.info("🛑 Web admin panel stopped")
     
-    def _run_server(self):
-        """Run the Flask server"""
+    def _create_server(self):
+        """Create the WSGI server bound to port 8080"""
+        if WAITRESS_AVAILABLE:
+            logger.info(f"🌐 Serving web admin with waitress ({WSGI_THREADS} threads)")
+            return waitress_create_server(self.app, host='0.0.0.0', port=8080, threads=WSGI_THREADS)
+        
+        # Thread per request, so a slow component call does not hold up other endpoints
+        logger.info("💡 Install waitress for a production server: pip install waitress")
+        return make_server('0.0.0.0', 8080, self.app, threaded=True)
+    
+    def _run_server(self, server):
+        """Serve requests until stop() closes the server"""
         try:
-            self.app.run(host='0.0.0.0', port=8080, debug=False, use_reloader=False)
+            if WAITRESS_AVAILABLE:
+                server.run()
+            else:
+                server.serve_forever()
         except Exception as e:
             logger.error(f"Web admin server error: {e}")
     
